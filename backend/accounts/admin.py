@@ -17,6 +17,14 @@ class UserAdmin(BaseUserAdmin):
     list_filter = ['role', 'is_active', 'is_staff', 'date_joined']
     search_fields = ['email', 'username', 'first_name', 'last_name']
     ordering = ['-date_joined']
+    list_select_related = True
+    
+    # Columns loaded for the changelist; the password hash and other unused
+    # fields are deferred.
+    changelist_only_fields = [
+        'id', 'email', 'username', 'first_name', 'last_name', 'role',
+        'is_active', 'is_staff', 'date_joined', 'last_login',
+    ]
     
     fieldsets = (
         (None, {'fields': ('email', 'username', 'password')}),
@@ -38,29 +46,29 @@ class UserAdmin(BaseUserAdmin):
     
     actions = ['promote_to_instructor', 'promote_to_admin', 'demote_to_student']
     
+    def get_queryset(self, request):
+        """Restrict changelist queries to the columns it renders."""
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        changelist_url = f'{self.opts.app_label}_{self.opts.model_name}_changelist'
+        if match is not None and match.url_name == changelist_url:
+            queryset = queryset.only(*self.changelist_only_fields)
+        return queryset
+    
     def promote_to_instructor(self, request, queryset):
         """Admin action to promote users to instructor."""
-        count = 0
-        for user in queryset:
-            user.promote_to_instructor()
-            count += 1
+        count = queryset.update(role='instructor')
         self.message_user(request, f'{count} user(s) promoted to instructor.')
     promote_to_instructor.short_description = 'Promote selected users to Instructor'
     
     def promote_to_admin(self, request, queryset):
         """Admin action to promote users to admin."""
-        count = 0
-        for user in queryset:
-            user.promote_to_admin()
-            count += 1
+        count = queryset.update(role='admin', is_staff=True, is_superuser=True)
         self.message_user(request, f'{count} user(s) promoted to admin.')
     promote_to_admin.short_description = 'Promote selected users to Admin'
     
     def demote_to_student(self, request, queryset):
         """Admin action to demote users to student."""
-        count = 0
-        for user in queryset:
-            user.demote_to_student()
-            count += 1
+        count = queryset.update(role='student', is_staff=False, is_superuser=False)
         self.message_user(request, f'{count} user(s) demoted to student.')
     demote_to_student.short_description = 'Demote selected users to Student'
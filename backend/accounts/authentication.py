@@ -0,0 +1,20 @@
+"""
+Authentication classes for the accounts app.
+"""
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+
+class RoleCachingJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that records the authenticated state and role on the
+    request, so permission classes can skip repeated user lookups.
+    """
+    
+    def authenticate(self, request):
+        result = super().authenticate(request)
+        if result is not None:
+            user, _ = result
+            request._is_authenticated = True
+            request._cached_role = user.role
+        return result
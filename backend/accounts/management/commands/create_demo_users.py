@@ -1,3 +1,4 @@
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
 from accounts.models import User
 
@@ -25,17 +26,30 @@ class Command(BaseCommand):
             }
         ]
 
+        emails = [user_data['email'] for user_data in users_data]
+        existing = set(
+            User.objects.filter(email__in=emails).values_list('email', flat=True)
+        )
+
+        # Hash each distinct demo password once; seeds often share passwords.
+        password_hashes = {}
+        new_users = []
         for user_data in users_data:
+            if user_data['email'] in existing:
+                continue
             password = user_data.pop('password')
-            user, created = User.objects.get_or_create(
-                email=user_data['email'],
-                defaults=user_data
-            )
-            if created:
-                user.set_password(password)
-                user.save()
-                self.stdout.write(self.style.SUCCESS(f'Created user: {user.email}'))
+            if password not in password_hashes:
+                password_hashes[password] = make_password(password)
+            new_users.append(User(password=password_hashes[password], **user_data))
+
+        # Existing users were filtered out above, so reruns insert nothing
+        User.objects.bulk_create(new_users)
+        created = {user.email for user in new_users}
+
+        for email in emails:
+            if email in created:
+                self.stdout.write(self.style.SUCCESS(f'Created user: {email}'))
             else:
-                self.stdout.write(f'User already exists: {user.email}')
+                self.stdout.write(f'User already exists: {email}')
 
         self.stdout.write(self.style.SUCCESS('Demo users creation completed!'))
\ No newline at end of file
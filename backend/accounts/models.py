@@ -24,6 +24,18 @@ class User(AbstractUser):
         ('admin', 'Admin'),
     ]
     
+    # Bit flags per role, used by the is_* role properties below
+    ROLE_STUDENT = 1
+    ROLE_INSTRUCTOR = 2
+    ROLE_PHARMACIST = 4
+    ROLE_ADMIN = 8
+    ROLE_FLAGS = {
+        'student': ROLE_STUDENT,
+        'instructor': ROLE_INSTRUCTOR,
+        'pharmacist': ROLE_PHARMACIST,
+        'admin': ROLE_ADMIN,
+    }
+    
     email = models.EmailField(
         unique=True,
         error_messages={
@@ -46,45 +58,78 @@ class User(AbstractUser):
         verbose_name = 'User'
         verbose_name_plural = 'Users'
         ordering = ['-date_joined']
+        indexes = [
+            # Serves role filters (admin list_filter, user management) and
+            # their default newest-first ordering.
+            models.Index(fields=['role', '-date_joined']),
+        ]
     
     def __str__(self):
         return f"{self.email} ({self.get_role_display()})"
     
+    @property
+    def role_flags(self):
+        """
+        Bit mask for the user's current role.
+        
+        Derived from ``role`` on each access rather than cached, since the
+        role can change on a live instance (see the promote/demote helpers).
+        """
+        return self.ROLE_FLAGS.get(self.role, 0)
+    
     @property
     def is_student(self):
         """Check if user has student role."""
-        return self.role == 'student'
+        return bool(self.role_flags & self.ROLE_STUDENT)
     
     @property
     def is_instructor(self):
         """Check if user has instructor role."""
-        return self.role == 'instructor'
+        return bool(self.role_flags & self.ROLE_INSTRUCTOR)
     
     @property
     def is_pharmacist(self):
         """Check if user has pharmacist role."""
-        return self.role == 'pharmacist'
+        return bool(self.role_flags & self.ROLE_PHARMACIST)
     
     @property
     def is_admin_user(self):
         """Check if user has admin role."""
-        return self.role == 'admin'
+        return bool(self.role_flags & self.ROLE_ADMIN)
+    
+    @classmethod
+    def bulk_set_role(cls, user_ids, role, *, staff=None, superuser=None):
+        """
+        Set the role of several users with a single UPDATE.
+        
+        The update bypasses save() and model signals. ``staff`` and
+        ``superuser`` are only written when given.
+        
+        Returns:
+            Number of users updated
+        """
+        fields = {'role': role}
+        if staff is not None:
+            fields['is_staff'] = staff
+        if superuser is not None:
+            fields['is_superuser'] = superuser
+        return cls.objects.filter(pk__in=user_ids).update(**fields)
     
     def promote_to_instructor(self):
         """Promote user to instructor role."""
         self.role = 'instructor'
-        self.save(update_fields=['role'])
+        self.bulk_set_role([self.pk], self.role)
     
     def promote_to_admin(self):
         """Promote user to admin role."""
         self.role = 'admin'
         self.is_staff = True
         self.is_superuser = True
-        self.save(update_fields=['role', 'is_staff', 'is_superuser'])
+        self.bulk_set_role([self.pk], self.role, staff=True, superuser=True)
     
     def demote_to_student(self):
         """Demote user to student role."""
         self.role = 'student'
         self.is_staff = False
         self.is_superuser = False
-        self.save(update_fields=['role', 'is_staff', 'is_superuser'])
+        self.bulk_set_role([self.pk], self.role, staff=False, superuser=False)
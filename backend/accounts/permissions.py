@@ -2,105 +2,99 @@
 Custom permission classes for role-based access control.
 """
 
+from functools import lru_cache, wraps
+
 from rest_framework import permissions
+from rest_framework.exceptions import NotAuthenticated, PermissionDenied
 
 
-class IsStudent(permissions.BasePermission):
-    """
-    Permission class that allows access only to users with student role.
-    """
-    
-    def has_permission(self, request, view):
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role == 'student'
-        )
+# Role sets are built once at import time so membership checks are O(1)
+# and no list literal is rebuilt per request.
+INSTRUCTOR_OR_ADMIN_ROLES = frozenset({'instructor', 'admin'})
+SAFE_METHODS = frozenset(permissions.SAFE_METHODS)
 
 
-class IsInstructor(permissions.BasePermission):
-    """
-    Permission class that allows access only to users with instructor role.
+def _is_authenticated(request):
     """
+    Check whether the request is authenticated.
     
-    def has_permission(self, request, view):
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role == 'instructor'
-        )
-
-
-class IsPharmacist(permissions.BasePermission):
-    """
-    Permission class that allows access only to users with pharmacist role.
+    Uses the flag set by RoleCachingJWTAuthentication when present and
+    falls back to the user's is_authenticated attribute otherwise.
     """
-    
-    def has_permission(self, request, view):
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role == 'pharmacist'
-        )
+    if getattr(request, '_is_authenticated', False):
+        return True
+    return bool(request.user and request.user.is_authenticated)
 
 
-class IsAdmin(permissions.BasePermission):
-    """
-    Permission class that allows access only to users with admin role.
+def _get_role(request):
     """
+    Return the authenticated user's role, memoized on the request.
     
-    def has_permission(self, request, view):
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role == 'admin'
-        )
+    Views commonly stack several permission classes; caching the role here
+    means the user object is only consulted once per request.
+    """
+    role = getattr(request, '_cached_role', None)
+    if role is None:
+        role = request._cached_role = request.user.role
+    return role
 
 
-class IsStudentOrInstructor(permissions.BasePermission):
+@lru_cache(maxsize=None)
+def role_required(*roles):
     """
-    Permission class that allows access to users with student or instructor role.
+    Build a permission class that allows access to users with any of the
+    given roles.
+    
+    Classes are cached per role combination, so repeated calls return the
+    same class.
+    
+    Usage:
+        permission_classes = [IsAuthenticated, role_required('instructor', 'admin')]
+    
+    Args:
+        *roles: Variable number of role strings ('student', 'instructor', 'admin')
+    
+    Returns:
+        A BasePermission subclass
     """
+    allowed_roles = frozenset(roles)
     
-    def has_permission(self, request, view):
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role in ['student', 'instructor']
-        )
+    class RolePermission(permissions.BasePermission):
+        def has_permission(self, request, view):
+            return _is_authenticated(request) and _get_role(request) in allowed_roles
+    
+    name = 'Is' + 'Or'.join(role.capitalize() for role in roles)
+    RolePermission.__name__ = RolePermission.__qualname__ = name
+    RolePermission.__doc__ = (
+        f"Permission class that allows access only to users with role(s): {', '.join(roles)}."
+    )
+    return RolePermission
 
 
-class IsInstructorOrAdmin(permissions.BasePermission):
-    """
-    Permission class that allows access to users with instructor or admin role.
-    """
-    
-    def has_permission(self, request, view):
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role in ['instructor', 'admin']
-        )
+IsStudent = role_required('student')
+IsInstructor = role_required('instructor')
+IsPharmacist = role_required('pharmacist')
+IsAdmin = role_required('admin')
+IsStudentOrInstructor = role_required('student', 'instructor')
+IsInstructorOrAdmin = role_required('instructor', 'admin')
 
 
 class IsOwnerOrAdmin(permissions.BasePermission):
     """
     Permission class that allows access to object owner or admin.
-    Requires the object to have a 'user' or 'owner' attribute.
+    
+    The owning field is read from the view's ``owner_field`` attribute,
+    defaulting to ``'user'``; views whose objects use a different field
+    (e.g. ``owner``) should declare it.
     """
     
     def has_object_permission(self, request, view, obj):
         # Admin has full access
-        if request.user.role == 'admin':
+        if _get_role(request) == 'admin':
             return True
         
-        # Check if object has user or owner attribute
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
-        elif hasattr(obj, 'owner'):
-            return obj.owner == request.user
-        
-        return False
+        owner_field = getattr(view, 'owner_field', 'user')
+        return getattr(obj, owner_field, None) == request.user
 
 
 class IsInstructorOrReadOnly(permissions.BasePermission):
@@ -110,15 +104,15 @@ class IsInstructorOrReadOnly(permissions.BasePermission):
     """
     
     def has_permission(self, request, view):
-        if not request.user or not request.user.is_authenticated:
+        if not _is_authenticated(request):
             return False
         
-        # Read permissions for all authenticated users
-        if request.method in permissions.SAFE_METHODS:
-            return True
-        
-        # Write permissions only for instructors and admins
-        return request.user.role in ['instructor', 'admin']
+        # Read permissions for all authenticated users, write permissions
+        # only for instructors and admins
+        return (
+            request.method in SAFE_METHODS or
+            _get_role(request) in INSTRUCTOR_OR_ADMIN_ROLES
+        )
 
 
 def require_role(*roles):
@@ -136,14 +130,15 @@ def require_role(*roles):
     Returns:
         Decorator function that checks if user has one of the specified roles
     """
+    allowed_roles = frozenset(roles)
+    
     def decorator(view_func):
+        @wraps(view_func)
         def wrapped_view(request, *args, **kwargs):
-            if not request.user or not request.user.is_authenticated:
-                from rest_framework.exceptions import NotAuthenticated
+            if not _is_authenticated(request):
                 raise NotAuthenticated("Authentication required")
             
-            if request.user.role not in roles:
-                from rest_framework.exceptions import PermissionDenied
+            if _get_role(request) not in allowed_roles:
                 raise PermissionDenied(
                     f"This action requires one of the following roles: {', '.join(roles)}"
                 )
@@ -6,14 +6,59 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework_simplejwt.tokens import RefreshToken
 
 User = get_user_model()
 
 
+class FastEmailField(serializers.EmailField):
+    """
+    EmailField that rejects obviously malformed input before running
+    Django's EmailValidator regex.
+    
+    Length is left to the usual max_length validation, so over-long
+    addresses get the same error as from EmailField.
+    """
+    
+    def to_internal_value(self, data):
+        if not isinstance(data, str) or data.count('@') != 1:
+            self.fail('invalid')
+        return super().to_internal_value(data)
+
+
+# Model serializers build FastEmailField for model EmailFields, keeping the
+# generated unique validators and max_length.
+FAST_EMAIL_FIELD_MAPPING = {
+    **serializers.ModelSerializer.serializer_field_mapping,
+    models.EmailField: FastEmailField,
+}
+
+
+def _validate_password_pair(attrs):
+    """Check that the two password fields match and meet strength rules."""
+    if attrs['password'] != attrs['password_confirm']:
+        raise serializers.ValidationError({
+            "password": "Password fields didn't match."
+        })
+    
+    # Validate password strength
+    try:
+        validate_password(attrs['password'])
+    except DjangoValidationError as e:
+        raise serializers.ValidationError({
+            "password": e.messages
+        })
+    
+    return attrs
+
+
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for User model."""
     
+    serializer_field_mapping = FAST_EMAIL_FIELD_MAPPING
+    
     class Meta:
         model = User
         fields = ['id', 'email', 'username', 'first_name', 'last_name', 'role', 'date_joined']
@@ -23,6 +68,8 @@ class UserSerializer(serializers.ModelSerializer):
 class RegisterSerializer(serializers.ModelSerializer):
     """Serializer for user registration."""
     
+    serializer_field_mapping = FAST_EMAIL_FIELD_MAPPING
+    
     password = serializers.CharField(
         write_only=True,
         required=True,
@@ -44,20 +91,7 @@ class RegisterSerializer(serializers.ModelSerializer):
     
     def validate(self, attrs):
         """Validate password match and strength."""
-        if attrs['password'] != attrs['password_confirm']:
-            raise serializers.ValidationError({
-                "password": "Password fields didn't match."
-            })
-        
-        # Validate password strength
-        try:
-            validate_password(attrs['password'])
-        except DjangoValidationError as e:
-            raise serializers.ValidationError({
-                "password": list(e.messages)
-            })
-        
-        return attrs
+        return _validate_password_pair(attrs)
     
     def create(self, validated_data):
         """Create user with encrypted password."""
@@ -75,7 +109,7 @@ class RegisterSerializer(serializers.ModelSerializer):
 class LoginSerializer(serializers.Serializer):
     """Serializer for user login."""
     
-    email = serializers.EmailField(required=True)
+    email = FastEmailField(required=True)
     password = serializers.CharField(
         required=True,
         write_only=True,
@@ -83,10 +117,20 @@ class LoginSerializer(serializers.Serializer):
     )
 
 
+class RoleTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Token pair serializer that embeds the user's role as a claim."""
+    
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token['role'] = user.role
+        return token
+
+
 class PasswordResetRequestSerializer(serializers.Serializer):
     """Serializer for password reset request."""
     
-    email = serializers.EmailField(required=True)
+    email = FastEmailField(required=True)
 
 
 class PasswordResetConfirmSerializer(serializers.Serializer):
@@ -106,17 +150,4 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
     
     def validate(self, attrs):
         """Validate password match and strength."""
-        if attrs['password'] != attrs['password_confirm']:
-            raise serializers.ValidationError({
-                "password": "Password fields didn't match."
-            })
-        
-        # Validate password strength
-        try:
-            validate_password(attrs['password'])
-        except DjangoValidationError as e:
-            raise serializers.ValidationError({
-                "password": list(e.messages)
-            })
-        
-        return attrs
+        return _validate_password_pair(attrs)
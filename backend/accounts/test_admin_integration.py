@@ -10,34 +10,78 @@ Requirements: 2.2, 4.1
 """
 
 import json
-import tempfile
-import csv
 from decimal import Decimal
-from django.test import TestCase
+from functools import lru_cache
+from django.conf import settings
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
-from rest_framework.test import APITestCase
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from accounts.views import AnalyticsView, SystemHealthView, UserManagementView
 from exams.models import Question, ExamAttempt, ExamAnswer
+from exams.views import QuestionViewSet
 from hub3660.models import Course, Enrollment
 from payments.models import Transaction
 
 User = get_user_model()
 
+# Permission-denied tests call views directly, skipping middleware and JWTs
+api_factory = APIRequestFactory()
 
-class AdminUserManagementIntegrationTest(APITestCase):
-    """Test complete user role promotion workflow."""
+
+@lru_cache(maxsize=None)
+def hashed_password(raw_password):
+    """
+    Return a hash of a fixture password, computed once per test run.
     
-    def setUp(self):
-        """Set up test data."""
-        # Create admin user
-        self.admin_user = User.objects.create_user(
+    All classes here share TEST_PASSWORD_HASHERS, so a cached hash stays
+    valid for every login regardless of which class produced it first.
+    """
+    return make_password(raw_password)
+
+
+# User columns touched by role promotion and (de)activation
+ROLE_STATE_FIELDS = ['role', 'is_staff', 'is_superuser', 'is_active']
+
+# Upload payloads are constant, so encode them once at import time
+MCQ_CSV_BYTES = (
+    b'text,option_a,option_b,option_c,option_d,correct_answer,category,difficulty\r\n'
+    b'What is 2+2?,3,4,5,6,B,Mathematics,easy\r\n'
+    b'What is the capital of France?,London,Berlin,Paris,Madrid,C,Geography,medium\r\n'
+    b'Which element has symbol O?,Gold,Oxygen,Silver,Iron,B,Chemistry,easy\r\n'
+    b'What is 10*10?,50,100,200,1000,B,Mathematics,medium\r\n'
+    b'Who wrote Romeo and Juliet?,Shakespeare,Dickens,Austen,Tolkien,A,Literature,hard\r\n'
+)
+MALFORMED_CSV_BYTES = b'invalid,csv,content\r\ndata1,data2,data3\r\n'  # Missing required columns
+
+
+def make_upload(name, content=b'', content_type='text/csv'):
+    """Build an in-memory upload for the MCQ import endpoint."""
+    return SimpleUploadedFile(name, content, content_type=content_type)
+
+
+# Queries issued by one admin analytics request; independent of row counts,
+# so an N+1 regression in the view shows up as a mismatch.
+ANALYTICS_QUERY_COUNT = 52
+
+
+@override_settings(PASSWORD_HASHERS=settings.TEST_PASSWORD_HASHERS)
+class AdminIntegrationTestBase(APITestCase):
+    """Base class providing an admin user and admin-authenticated client."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create the admin user shared by every test in the class."""
+        cls.admin_user = User.objects.create(
             username='admin',
             email='admin@example.com',
-            password='adminpass123',
+            password=hashed_password('adminpass123'),
             first_name='Admin',
             last_name='User',
             role='admin',
@@ -45,28 +89,40 @@ class AdminUserManagementIntegrationTest(APITestCase):
             is_superuser=True
         )
         
+        # Sign the admin JWT once; tests only reuse the header value
+        cls.admin_auth = f'Bearer {RefreshToken.for_user(cls.admin_user).access_token}'
+    
+    def setUp(self):
+        """Authenticate as admin."""
+        self.client.credentials(HTTP_AUTHORIZATION=self.admin_auth)
+
+
+class AdminUserManagementIntegrationTest(AdminIntegrationTestBase):
+    """Test complete user role promotion workflow."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        super().setUpTestData()
+        
         # Create test users with different roles
-        self.student_user = User.objects.create_user(
+        cls.student_user = User.objects.create(
             username='student',
             email='student@example.com',
-            password='studentpass123',
+            password=hashed_password('studentpass123'),
             first_name='Student',
             last_name='User',
             role='student'
         )
         
-        self.instructor_user = User.objects.create_user(
+        cls.instructor_user = User.objects.create(
             username='instructor',
             email='instructor@example.com',
-            password='instructorpass123',
+            password=hashed_password('instructorpass123'),
             first_name='Instructor',
             last_name='User',
             role='instructor'
         )
-        
-        # Authenticate as admin
-        refresh = RefreshToken.for_user(self.admin_user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
     
     def test_user_role_promotion_complete_flow(self):
         """Test complete user role promotion workflow."""
@@ -80,9 +136,10 @@ class AdminUserManagementIntegrationTest(APITestCase):
         
         # Verify user data structure
         user_data = response.data['results'][0]
-        expected_fields = ['id', 'email', 'first_name', 'last_name', 'role', 'is_active', 'date_joined', 'last_login']
-        for field in expected_fields:
-            self.assertIn(field, user_data)
+        self.assertGreaterEqual(user_data.keys(), {
+            'id', 'email', 'first_name', 'last_name', 'role',
+            'is_active', 'date_joined', 'last_login',
+        })
         
         # Test 2: Promote student to instructor
         student_id = self.student_user.id
@@ -94,10 +151,6 @@ class AdminUserManagementIntegrationTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['role'], 'instructor')
         
-        # Verify database was updated
-        self.student_user.refresh_from_db()
-        self.assertEqual(self.student_user.role, 'instructor')
-        
         # Test 3: Promote instructor to admin
         instructor_id = self.instructor_user.id
         url = reverse('accounts:admin_user_detail', kwargs={'user_id': instructor_id})
@@ -108,11 +161,12 @@ class AdminUserManagementIntegrationTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['role'], 'admin')
         
-        # Verify database was updated with admin privileges
-        self.instructor_user.refresh_from_db()
-        self.assertEqual(self.instructor_user.role, 'admin')
-        self.assertTrue(self.instructor_user.is_staff)
-        self.assertTrue(self.instructor_user.is_superuser)
+        # Verify database was updated with admin privileges (the response
+        # body does not expose the staff flags)
+        self.assertEqual(
+            User.objects.values_list(*ROLE_STATE_FIELDS).get(id=instructor_id),
+            ('admin', True, True, True)
+        )
         
         # Test 4: Demote admin back to student
         promotion_data = {'role': 'student'}
@@ -121,12 +175,6 @@ class AdminUserManagementIntegrationTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['role'], 'student')
         
-        # Verify admin privileges were removed
-        self.instructor_user.refresh_from_db()
-        self.assertEqual(self.instructor_user.role, 'student')
-        self.assertFalse(self.instructor_user.is_staff)
-        self.assertFalse(self.instructor_user.is_superuser)
-        
         # Test 5: Deactivate user
         deactivation_data = {'is_active': False}
         response = self.client.patch(url, deactivation_data, format='json')
@@ -134,10 +182,6 @@ class AdminUserManagementIntegrationTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertFalse(response.data['is_active'])
         
-        # Verify database was updated
-        self.instructor_user.refresh_from_db()
-        self.assertFalse(self.instructor_user.is_active)
-        
         # Test 6: Reactivate user
         reactivation_data = {'is_active': True}
         response = self.client.patch(url, reactivation_data, format='json')
@@ -145,26 +189,35 @@ class AdminUserManagementIntegrationTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(response.data['is_active'])
         
-        # Verify database was updated
-        self.instructor_user.refresh_from_db()
-        self.assertTrue(self.instructor_user.is_active)
+        # Verify the final database state of both users in one query:
+        # admin privileges were removed and the student was promoted
+        final_state = {
+            user_id: state
+            for user_id, *state in User.objects.filter(
+                id__in=[student_id, instructor_id]
+            ).values_list('id', *ROLE_STATE_FIELDS)
+        }
+        self.assertEqual(final_state, {
+            student_id: ['instructor', False, False, True],
+            instructor_id: ['student', False, False, True],
+        })
     
     def test_user_management_filtering_and_search(self):
         """Test user management filtering and search functionality."""
         # Create additional test users
-        User.objects.create_user(
+        User.objects.create(
             username='pharmacist1',
             email='pharmacist1@example.com',
-            password='pass123',
+            password=hashed_password('pass123'),
             first_name='Pharmacist',
             last_name='One',
             role='pharmacist'
         )
         
-        User.objects.create_user(
+        User.objects.create(
             username='inactive_user',
             email='inactive@example.com',
-            password='pass123',
+            password=hashed_password('pass123'),
             first_name='Inactive',
             last_name='User',
             role='student',
@@ -208,97 +261,76 @@ class AdminUserManagementIntegrationTest(APITestCase):
         self.assertIn('Cannot deactivate your own account', response.data['detail'])
         
         # Verify admin is still active
-        self.admin_user.refresh_from_db()
+        self.admin_user.refresh_from_db(fields=['is_active'])
         self.assertTrue(self.admin_user.is_active)
     
     def test_non_admin_cannot_access_user_management(self):
         """Test that non-admin users cannot access user management endpoints."""
-        # Authenticate as student
-        refresh = RefreshToken.for_user(self.student_user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        view = UserManagementView.as_view()
         
-        # Try to access user list
-        url = reverse('accounts:admin_users')
-        response = self.client.get(url)
+        # Try to access user list as a student
+        request = api_factory.get(reverse('accounts:admin_users'))
+        force_authenticate(request, user=self.student_user)
+        response = view(request)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         
         # Try to update user role
-        url = reverse('accounts:admin_user_detail', kwargs={'user_id': self.instructor_user.id})
-        response = self.client.patch(url, {'role': 'admin'}, format='json')
+        user_id = self.instructor_user.id
+        url = reverse('accounts:admin_user_detail', kwargs={'user_id': user_id})
+        request = api_factory.patch(url, {'role': 'admin'}, format='json')
+        force_authenticate(request, user=self.student_user)
+        response = view(request, user_id=user_id)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
 
-class AdminMCQImportIntegrationTest(APITestCase):
+class AdminMCQImportIntegrationTest(AdminIntegrationTestBase):
     """Test complete MCQ import workflow."""
     
-    def setUp(self):
-        """Set up test data."""
-        # Create admin user
-        self.admin_user = User.objects.create_user(
-            username='admin',
-            email='admin@example.com',
-            password='adminpass123',
-            first_name='Admin',
-            last_name='User',
-            role='admin',
-            is_staff=True,
-            is_superuser=True
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        super().setUpTestData()
         
         # Create non-admin user for permission testing
-        self.student_user = User.objects.create_user(
+        cls.student_user = User.objects.create(
             username='student',
             email='student@example.com',
-            password='studentpass123',
+            password=hashed_password('studentpass123'),
             first_name='Student',
             last_name='User',
             role='student'
         )
-        
-        # Authenticate as admin
-        refresh = RefreshToken.for_user(self.admin_user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
     
     def test_mcq_import_csv_complete_flow(self):
         """Test complete MCQ import workflow using CSV file."""
-        # Create temporary CSV file with test questions
-        csv_content = [
-            ['text', 'option_a', 'option_b', 'option_c', 'option_d', 'correct_answer', 'category', 'difficulty'],
-            ['What is 2+2?', '3', '4', '5', '6', 'B', 'Mathematics', 'easy'],
-            ['What is the capital of France?', 'London', 'Berlin', 'Paris', 'Madrid', 'C', 'Geography', 'medium'],
-            ['Which element has symbol O?', 'Gold', 'Oxygen', 'Silver', 'Iron', 'B', 'Chemistry', 'easy'],
-            ['What is 10*10?', '50', '100', '200', '1000', 'B', 'Mathematics', 'medium'],
-            ['Who wrote Romeo and Juliet?', 'Shakespeare', 'Dickens', 'Austen', 'Tolkien', 'A', 'Literature', 'hard']
-        ]
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as temp_file:
-            writer = csv.writer(temp_file)
-            writer.writerows(csv_content)
-            temp_file_path = temp_file.name
+        # Upload the CSV test questions
+        csv_file = make_upload('questions.csv', MCQ_CSV_BYTES)
         
         # Test 1: Import questions via API
         url = reverse('exams:question-import-questions')
-        
-        with open(temp_file_path, 'rb') as csv_file:
-            response = self.client.post(url, {'file': csv_file}, format='multipart')
+        response = self.client.post(url, {'file': csv_file}, format='multipart')
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertIn('imported_count', response.data)
         self.assertEqual(response.data['imported_count'], 5)  # 5 questions imported
         
         # Test 2: Verify questions were created in database
-        questions = Question.objects.all()
-        self.assertEqual(questions.count(), 5)
+        self.assertEqual(Question.objects.count(), 5)
         
         # Test 3: Verify question data integrity
-        math_question = Question.objects.get(text='What is 2+2?')
-        self.assertEqual(math_question.option_a, '3')
-        self.assertEqual(math_question.option_b, '4')
-        self.assertEqual(math_question.option_c, '5')
-        self.assertEqual(math_question.option_d, '6')
-        self.assertEqual(math_question.correct_answer, 'B')
-        self.assertEqual(math_question.category, 'Mathematics')
-        self.assertEqual(math_question.difficulty, 'easy')
+        math_question = Question.objects.filter(text='What is 2+2?').values(
+            'option_a', 'option_b', 'option_c', 'option_d',
+            'correct_answer', 'category', 'difficulty',
+        ).get()
+        self.assertEqual(math_question, {
+            'option_a': '3',
+            'option_b': '4',
+            'option_c': '5',
+            'option_d': '6',
+            'correct_answer': 'B',
+            'category': 'Mathematics',
+            'difficulty': 'easy',
+        })
         
         # Test 4: Verify questions can be retrieved
         url = reverse('exams:question-list')
@@ -315,10 +347,6 @@ class AdminMCQImportIntegrationTest(APITestCase):
         response = self.client.get(url, {'difficulty': 'easy'})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 2)  # 2 easy questions
-        
-        # Clean up
-        import os
-        os.unlink(temp_file_path)
     
     def test_mcq_import_json_complete_flow(self):
         """Test complete MCQ import workflow using JSON file."""
@@ -346,15 +374,13 @@ class AdminMCQImportIntegrationTest(APITestCase):
             }
         ]
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-            json.dump(json_content, temp_file)
-            temp_file_path = temp_file.name
+        json_file = make_upload(
+            'questions.json', json.dumps(json_content).encode(), content_type='application/json'
+        )
         
         # Test import
         url = reverse('exams:question-import-questions')
-        
-        with open(temp_file_path, 'rb') as json_file:
-            response = self.client.post(url, {'file': json_file}, format='multipart')
+        response = self.client.post(url, {'file': json_file}, format='multipart')
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['imported_count'], 2)
@@ -366,127 +392,89 @@ class AdminMCQImportIntegrationTest(APITestCase):
         jupiter_question = questions.first()
         self.assertEqual(jupiter_question.text, 'What is the largest planet?')
         self.assertEqual(jupiter_question.correct_answer, 'B')
-        
-        # Clean up
-        import os
-        os.unlink(temp_file_path)
     
     def test_mcq_import_error_handling(self):
         """Test MCQ import error handling."""
         # Test 1: Invalid file format
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as temp_file:
-            temp_file.write('Invalid content')
-            temp_file_path = temp_file.name
+        invalid_file = make_upload('questions.txt', b'Invalid content', content_type='text/plain')
         
         url = reverse('exams:question-import-questions')
-        
-        with open(temp_file_path, 'rb') as invalid_file:
-            response = self.client.post(url, {'file': invalid_file}, format='multipart')
+        response = self.client.post(url, {'file': invalid_file}, format='multipart')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         # Check for validation error in file field
         self.assertIn('file', response.data)
         
         # Test 2: Malformed CSV (missing required columns)
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as temp_file:
-            writer = csv.writer(temp_file)
-            writer.writerow(['invalid', 'csv', 'content'])  # Missing required columns
-            writer.writerow(['data1', 'data2', 'data3'])
-            temp_file_path2 = temp_file.name
+        malformed_file = make_upload('malformed.csv', MALFORMED_CSV_BYTES)
         
-        with open(temp_file_path2, 'rb') as malformed_file:
-            response = self.client.post(url, {'file': malformed_file}, format='multipart')
+        response = self.client.post(url, {'file': malformed_file}, format='multipart')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('error', response.data)
-        
-        # Clean up
-        import os
-        os.unlink(temp_file_path)
-        os.unlink(temp_file_path2)
     
     def test_non_admin_cannot_import_mcq(self):
         """Test that non-admin users cannot import MCQ."""
-        # Authenticate as student
-        refresh = RefreshToken.for_user(self.student_user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
-        
-        # Try to import questions
+        # Try to import questions as a student
         url = reverse('exams:question-import-questions')
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
-            temp_file.write('text,option_a,option_b,option_c,option_d,correct_answer\n')
-            temp_file.write('Test question,A,B,C,D,A\n')
-            temp_file_path = temp_file.name
-        
-        with open(temp_file_path, 'rb') as csv_file:
-            response = self.client.post(url, {'file': csv_file}, format='multipart')
+        csv_file = make_upload('questions.csv', MCQ_CSV_BYTES)
+        request = api_factory.post(url, {'file': csv_file}, format='multipart')
+        force_authenticate(request, user=self.student_user)
+        response = QuestionViewSet.as_view({'post': 'import_questions'})(request)
         
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         
         # Verify no questions were created
         self.assertEqual(Question.objects.count(), 0)
-        
-        # Clean up
-        import os
-        os.unlink(temp_file_path)
 
 
-class AdminAnalyticsIntegrationTest(APITestCase):
-    """Test complete analytics data retrieval workflow."""
+class AdminAnalyticsFixturesMixin:
+    """Shared analytics dataset for the admin analytics test classes."""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data with comprehensive analytics scenario."""
-        # Create admin user
-        self.admin_user = User.objects.create_user(
-            username='admin',
-            email='admin@example.com',
-            password='adminpass123',
-            first_name='Admin',
-            last_name='User',
-            role='admin',
-            is_staff=True,
-            is_superuser=True
-        )
+        super().setUpTestData()
         
         # Create test users with different roles
-        self.students = []
-        for i in range(5):
-            student = User.objects.create_user(
+        password = make_password(None)  # Unusable; these users never log in
+        cls.students = User.objects.bulk_create([
+            User(
                 username=f'student{i}',
                 email=f'student{i}@example.com',
-                password='pass123',
+                password=password,
                 first_name=f'Student{i}',
                 last_name='User',
                 role='student'
             )
-            self.students.append(student)
+            for i in range(5)
+        ])
         
-        self.instructors = []
-        for i in range(2):
-            instructor = User.objects.create_user(
+        cls.instructors = User.objects.bulk_create([
+            User(
                 username=f'instructor{i}',
                 email=f'instructor{i}@example.com',
-                password='pass123',
+                password=password,
                 first_name=f'Instructor{i}',
                 last_name='User',
                 role='instructor'
             )
-            self.instructors.append(instructor)
+            for i in range(2)
+        ])
         
-        self.pharmacist = User.objects.create_user(
+        cls.pharmacist = User.objects.create(
             username='pharmacist',
             email='pharmacist@example.com',
-            password='pass123',
+            password=password,
             first_name='Pharmacist',
             last_name='User',
             role='pharmacist'
         )
         
         # Create test courses
-        self.courses = []
-        for i, instructor in enumerate(self.instructors):
-            course = Course.objects.create(
+        cls.courses = Course.objects.bulk_create([
+            Course(
                 title=f'Test Course {i+1}',
                 description=f'Description for course {i+1}',
                 instructor=instructor,
@@ -494,33 +482,37 @@ class AdminAnalyticsIntegrationTest(APITestCase):
                 currency='USD',
                 is_published=True
             )
-            self.courses.append(course)
+            for i, instructor in enumerate(cls.instructors)
+        ])
         
         # Create test enrollments
-        for i, student in enumerate(self.students[:3]):  # 3 students enrolled
-            Enrollment.objects.create(
+        Enrollment.objects.bulk_create([
+            Enrollment(
                 student=student,
-                course=self.courses[0],
+                course=cls.courses[0],
                 payment_status='completed',
                 payment_id=f'pay_{i}'
             )
+            for i, student in enumerate(cls.students[:3])  # 3 students enrolled
+        ])
         
         # Create test transactions
-        for i, student in enumerate(self.students[:3]):
-            Transaction.objects.create(
+        Transaction.objects.bulk_create([
+            Transaction(
                 user=student,
                 amount=Decimal('99.99'),
                 currency='USD',
                 provider='stripe',
                 provider_transaction_id=f'txn_{i}',
                 status='completed',
-                metadata={'course_id': self.courses[0].id}
+                metadata={'course_id': cls.courses[0].id}
             )
+            for i, student in enumerate(cls.students[:3])
+        ])
         
         # Create test questions and exam attempts
-        self.questions = []
-        for i in range(10):
-            question = Question.objects.create(
+        cls.questions = Question.objects.bulk_create([
+            Question(
                 text=f'Test question {i+1}',
                 option_a='Option A',
                 option_b='Option B',
@@ -530,35 +522,44 @@ class AdminAnalyticsIntegrationTest(APITestCase):
                 category='Test Category' if i < 5 else 'Another Category',
                 difficulty='easy' if i < 3 else 'medium' if i < 7 else 'hard'
             )
-            self.questions.append(question)
+            for i in range(10)
+        ])
         
         # Create exam attempts
-        for i, student in enumerate(self.students[:2]):  # 2 students took exams
-            attempt = ExamAttempt.objects.create(
+        completed_at = timezone.now()
+        attempts = ExamAttempt.objects.bulk_create([
+            ExamAttempt(
                 student=student,
                 total_questions=5,
                 score=4 if i == 0 else 3,  # Different scores
                 status='completed',
-                completed_at=timezone.now()
+                completed_at=completed_at
             )
-            
-            # Add questions to attempt
-            for j in range(5):
-                ExamAnswer.objects.create(
-                    attempt=attempt,
-                    question=self.questions[j],
-                    selected_answer='A' if j < (4 if i == 0 else 3) else 'B',  # Some correct, some wrong
-                    is_correct=j < (4 if i == 0 else 3)
-                )
-        
-        # Authenticate as admin
-        refresh = RefreshToken.for_user(self.admin_user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+            for i, student in enumerate(cls.students[:2])  # 2 students took exams
+        ])
+        
+        # Add questions to attempts (is_correct matches what ExamAnswer.save
+        # would derive, since bulk_create bypasses it)
+        ExamAnswer.objects.bulk_create([
+            ExamAnswer(
+                attempt=attempt,
+                question=cls.questions[j],
+                selected_answer='A' if j < attempt.score else 'B',  # Some correct, some wrong
+                is_correct=j < attempt.score
+            )
+            for attempt in attempts
+            for j in range(5)
+        ])
+
+
+class AdminAnalyticsReadOnlyTest(AdminAnalyticsFixturesMixin, AdminIntegrationTestBase):
+    """Analytics tests that only read the shared dataset."""
     
     def test_analytics_data_retrieval_complete_flow(self):
         """Test complete analytics data retrieval workflow."""
         url = reverse('accounts:admin_analytics')
-        response = self.client.get(url)
+        with self.assertNumQueries(ANALYTICS_QUERY_COUNT):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
@@ -589,9 +590,9 @@ class AdminAnalyticsIntegrationTest(APITestCase):
         self.assertIsInstance(course_stats['top_courses'], list)
         if course_stats['top_courses']:
             top_course = course_stats['top_courses'][0]
-            expected_fields = ['id', 'title', 'instructor', 'enrollment_count', 'price', 'currency']
-            for field in expected_fields:
-                self.assertIn(field, top_course)
+            self.assertGreaterEqual(top_course.keys(), {
+                'id', 'title', 'instructor', 'enrollment_count', 'price', 'currency',
+            })
         
         # Test 3: Verify enrollment statistics
         enrollment_stats = response.data['enrollments']
@@ -609,44 +610,13 @@ class AdminAnalyticsIntegrationTest(APITestCase):
         self.assertIsInstance(revenue_stats['by_provider'], list)
         if revenue_stats['by_provider']:
             provider_data = revenue_stats['by_provider'][0]
-            expected_fields = ['provider', 'count', 'revenue']
-            for field in expected_fields:
-                self.assertIn(field, provider_data)
+            self.assertGreaterEqual(provider_data.keys(), {'provider', 'count', 'revenue'})
         
         # Test 5: Verify exam statistics
         exam_stats = response.data['exams']
         self.assertEqual(exam_stats['total_attempts'], 2)
         self.assertEqual(exam_stats['completed'], 2)
     
-    def test_analytics_with_no_data(self):
-        """Test analytics endpoint with minimal data."""
-        # Clear all test data except admin user
-        User.objects.exclude(id=self.admin_user.id).delete()
-        Course.objects.all().delete()
-        Enrollment.objects.all().delete()
-        Transaction.objects.all().delete()
-        ExamAttempt.objects.all().delete()
-        Question.objects.all().delete()
-        
-        url = reverse('accounts:admin_analytics')
-        response = self.client.get(url)
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
-        # Verify empty state handling
-        user_stats = response.data['users']
-        self.assertEqual(user_stats['total'], 1)  # Only admin
-        self.assertEqual(user_stats['by_role']['admin'], 1)
-        
-        course_stats = response.data['courses']
-        self.assertEqual(course_stats['total'], 0)
-        
-        enrollment_stats = response.data['enrollments']
-        self.assertEqual(enrollment_stats['total'], 0)
-        
-        revenue_stats = response.data['revenue']
-        self.assertEqual(float(revenue_stats['total']), 0.0)
-    
     def test_system_health_monitoring(self):
         """Test system health monitoring endpoint."""
         url = reverse('accounts:admin_health')
@@ -656,64 +626,94 @@ class AdminAnalyticsIntegrationTest(APITestCase):
         
         # Verify health data structure
         health_data = response.data
-        expected_fields = ['status', 'timestamp', 'checks']
-        for field in expected_fields:
-            self.assertIn(field, health_data)
+        self.assertGreaterEqual(health_data.keys(), {'status', 'timestamp', 'checks'})
         
         # Verify checks structure
         checks = health_data['checks']
-        expected_checks = ['database', 'error_rate', 'external_services']
+        expected_checks = {'database', 'error_rate', 'external_services'}
+        self.assertGreaterEqual(checks.keys(), expected_checks)
         for check in expected_checks:
-            self.assertIn(check, checks)
-            self.assertIn('status', checks[check])
-            self.assertIn('message', checks[check])
+            self.assertGreaterEqual(checks[check].keys(), {'status', 'message'})
         
         # Database check should be healthy
         self.assertEqual(checks['database']['status'], 'healthy')
     
     def test_non_admin_cannot_access_analytics(self):
         """Test that non-admin users cannot access analytics endpoints."""
-        # Authenticate as student
-        refresh = RefreshToken.for_user(self.students[0])
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        student = self.students[0]
         
-        # Try to access analytics
-        url = reverse('accounts:admin_analytics')
-        response = self.client.get(url)
+        # Try to access analytics as a student
+        request = api_factory.get(reverse('accounts:admin_analytics'))
+        force_authenticate(request, user=student)
+        response = AnalyticsView.as_view()(request)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         
         # Try to access system health
-        url = reverse('accounts:admin_health')
-        response = self.client.get(url)
+        request = api_factory.get(reverse('accounts:admin_health'))
+        force_authenticate(request, user=student)
+        response = SystemHealthView.as_view()(request)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class AdminAnalyticsEmptyStateTest(AdminIntegrationTestBase):
+    """Test analytics when only the admin user exists."""
+    
+    def test_analytics_with_no_data(self):
+        """Test analytics endpoint with minimal data."""
+        url = reverse('accounts:admin_analytics')
+        response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        # Verify empty state handling
+        user_stats = response.data['users']
+        self.assertEqual(user_stats['total'], 1)  # Only admin
+        self.assertEqual(user_stats['by_role']['admin'], 1)
+        
+        course_stats = response.data['courses']
+        self.assertEqual(course_stats['total'], 0)
+        
+        enrollment_stats = response.data['enrollments']
+        self.assertEqual(enrollment_stats['total'], 0)
+        
+        revenue_stats = response.data['revenue']
+        self.assertEqual(float(revenue_stats['total']), 0.0)
+
+
+class AdminAnalyticsIntegrationTest(AdminAnalyticsFixturesMixin, AdminIntegrationTestBase):
+    """Test analytics against an enlarged dataset."""
     
     def test_analytics_performance_with_large_dataset(self):
         """Test analytics performance with larger dataset."""
         # Create additional test data
-        additional_students = []
-        for i in range(50):  # Create 50 more students
-            student = User.objects.create_user(
+        password = make_password(None)  # Unusable; these users never log in
+        additional_students = User.objects.bulk_create([
+            User(
                 username=f'bulk_student{i}',
                 email=f'bulk_student{i}@example.com',
-                password='pass123',
+                password=password,
                 first_name=f'BulkStudent{i}',
                 last_name='User',
                 role='student'
             )
-            additional_students.append(student)
+            for i in range(50)  # Create 50 more students
+        ])
         
         # Create enrollments for some of them
-        for i, student in enumerate(additional_students[:25]):
-            Enrollment.objects.create(
+        Enrollment.objects.bulk_create([
+            Enrollment(
                 student=student,
                 course=self.courses[0],
                 payment_status='completed',
                 payment_id=f'bulk_pay_{i}'
             )
+            for i, student in enumerate(additional_students[:25])
+        ])
         
         # Test analytics still works efficiently
         url = reverse('accounts:admin_analytics')
-        response = self.client.get(url)
+        with self.assertNumQueries(ANALYTICS_QUERY_COUNT):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
@@ -725,46 +725,39 @@ class AdminAnalyticsIntegrationTest(APITestCase):
         self.assertEqual(enrollment_stats['total'], 28)  # Original 3 + 25 new
 
 
-class AdminIntegrationErrorHandlingTest(APITestCase):
+class AdminIntegrationErrorHandlingTest(AdminIntegrationTestBase):
     """Test error handling in admin integration workflows."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.admin_user = User.objects.create_user(
-            username='admin',
-            email='admin@example.com',
-            password='adminpass123',
-            role='admin',
-            is_staff=True,
-            is_superuser=True
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        super().setUpTestData()
         
-        refresh = RefreshToken.for_user(self.admin_user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        cls.student = User.objects.create(
+            username='student',
+            email='student@example.com',
+            password=hashed_password('pass123'),
+            role='student'
+        )
     
     def test_user_management_error_cases(self):
         """Test error handling in user management."""
         # Test 1: Update non-existent user
-        url = reverse('accounts:admin_user_detail', kwargs={'user_id': 99999})
-        response = self.client.patch(url, {'role': 'instructor'}, format='json')
-        
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-        self.assertIn('User not found', response.data['detail'])
+        with self.subTest(case='missing_user'):
+            url = reverse('accounts:admin_user_detail', kwargs={'user_id': 99999})
+            response = self.client.patch(url, {'role': 'instructor'}, format='json')
+            
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+            self.assertIn('User not found', response.data['detail'])
         
         # Test 2: Invalid role
-        student = User.objects.create_user(
-            username='student',
-            email='student@example.com',
-            password='pass123',
-            role='student'
-        )
-        
-        url = reverse('accounts:admin_user_detail', kwargs={'user_id': student.id})
-        response = self.client.patch(url, {'role': 'invalid_role'}, format='json')
-        
-        # Should not update role to invalid value
-        student.refresh_from_db()
-        self.assertEqual(student.role, 'student')  # Unchanged
+        with self.subTest(case='invalid_role'):
+            url = reverse('accounts:admin_user_detail', kwargs={'user_id': self.student.id})
+            response = self.client.patch(url, {'role': 'invalid_role'}, format='json')
+            
+            # Should not update role to invalid value
+            self.student.refresh_from_db(fields=['role'])
+            self.assertEqual(self.student.role, 'student')  # Unchanged
     
     def test_mcq_import_validation_errors(self):
         """Test MCQ import validation and error handling."""
@@ -775,28 +768,14 @@ class AdminIntegrationErrorHandlingTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         
         # Test 2: Empty file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
-            temp_file_path = temp_file.name
-        
-        with open(temp_file_path, 'rb') as empty_file:
-            response = self.client.post(url, {'file': empty_file}, format='multipart')
+        empty_file = make_upload('empty.csv')
+        response = self.client.post(url, {'file': empty_file}, format='multipart')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        
-        # Clean up
-        import os
-        os.unlink(temp_file_path)
     
     def test_analytics_error_resilience(self):
         """Test analytics endpoint resilience to data inconsistencies."""
-        # Create user with missing related data
-        User.objects.create_user(
-            username='orphan_user',
-            email='orphan@example.com',
-            password='pass123',
-            role='student'
-        )
-        
+        # The class student has no enrollments, payments or exam attempts.
         # Analytics should still work
         url = reverse('accounts:admin_analytics')
         response = self.client.get(url)
@@ -806,4 +785,86 @@ class AdminIntegrationErrorHandlingTest(APITestCase):
         self.assertIn('courses', response.data)
         self.assertIn('enrollments', response.data)
         self.assertIn('revenue', response.data)
-        self.assertIn('exams', response.data)
\ No newline at end of file
+        self.assertIn('exams', response.data)
+        
+        # Unchanged analytics are answered with 304 Not Modified
+        etag = response['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+
+@override_settings(PASSWORD_HASHERS=settings.TEST_PASSWORD_HASHERS)
+class UserAdminIntegrationTest(TestCase):
+    """Test the Django admin pages and role actions for users."""
+    
+    changelist_url = reverse('admin:accounts_user_changelist')
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create(
+            username='siteadmin',
+            email='siteadmin@example.com',
+            password=hashed_password('adminpass123'),
+            role='admin',
+            is_staff=True,
+            is_superuser=True
+        )
+        cls.users = User.objects.bulk_create([
+            User(
+                username=f'member{i}',
+                email=f'member{i}@example.com',
+                password=make_password(None)
+            )
+            for i in range(2)
+        ])
+    
+    def setUp(self):
+        self.client.force_login(self.superuser)
+    
+    def run_action(self, action):
+        return self.client.post(self.changelist_url, {
+            'action': action,
+            '_selected_action': [user.pk for user in self.users],
+        }, follow=True)
+    
+    def test_changelist_defers_unused_columns(self):
+        """Test the changelist loads only the columns it renders."""
+        response = self.client.get(self.changelist_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertContains(response, 'member0@example.com')
+        user = response.context['cl'].result_list[0]
+        self.assertIn('password', user.get_deferred_fields())
+    
+    def test_change_form_loads_full_user(self):
+        """Test the change form is not limited to the changelist columns."""
+        user = self.users[0]
+        url = reverse('admin:accounts_user_change', args=[user.pk])
+        response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.context['original'].pk, user.pk)
+        self.assertEqual(response.context['original'].get_deferred_fields(), set())
+    
+    def test_promote_and_demote_actions(self):
+        """Test the role actions update every selected user."""
+        expected_states = [
+            ('promote_to_instructor', 'promoted to instructor', ('instructor', False, False)),
+            ('promote_to_admin', 'promoted to admin', ('admin', True, True)),
+            ('demote_to_student', 'demoted to student', ('student', False, False)),
+        ]
+        for action, message, expected in expected_states:
+            with self.subTest(action=action):
+                response = self.run_action(action)
+                
+                self.assertRedirects(response, self.changelist_url)
+                self.assertContains(response, f'{len(self.users)} user(s) {message}.')
+                states = User.objects.filter(
+                    pk__in=[user.pk for user in self.users]
+                ).values_list('role', 'is_staff', 'is_superuser')
+                self.assertEqual(list(states), [expected] * len(self.users))
+                
+                # Untouched by the action
+                self.superuser.refresh_from_db()
+                self.assertEqual(self.superuser.role, 'admin')
@@ -3,56 +3,99 @@ Property-based tests for authentication system.
 Tests Properties 2, 3, and 5 from requirements.
 """
 import pytest
-from hypothesis import given, strategies as st
+from hypothesis import given, settings, strategies as st
 from hypothesis.extra.django import TestCase
+from django.conf import settings as django_settings
 from django.contrib.auth import get_user_model
-from django.urls import reverse
+from django.test import override_settings
+from django.urls import reverse_lazy
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.core import mail
-import json
+from django.core.cache import cache
 
 User = get_user_model()
 
+# Each example makes full HTTP round trips through the middleware stack, so
+# per-example timing is too noisy for a deadline. Example counts come from
+# the active profile (see conftest.py).
+http_example_settings = settings(deadline=None)
 
+# Generate plain ASCII values in the shape the endpoints accept rather than
+# filtering arbitrary text; passwords always mix letters and digits.
+emails = st.from_regex(r'[a-z][a-z0-9]{2,10}@example\.(com|org)', fullmatch=True)
+passwords = st.from_regex(r'[A-Za-z]{4,8}[0-9]{2,4}', fullmatch=True)
+
+
+@override_settings(PASSWORD_HASHERS=django_settings.TEST_PASSWORD_HASHERS)
 class AuthenticationPropertyTests(TestCase):
+    # Credentials of the user shared by every example; only the inputs sent
+    # to the endpoints vary, so no password is hashed inside the example loop
+    FIXTURE_EMAIL = 'prop@example.com'
+    FIXTURE_PASSWORD = 'FixedPass123'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.fixture_user = User.objects.create_user(
+            username='propuser',
+            email=cls.FIXTURE_EMAIL,
+            password=cls.FIXTURE_PASSWORD
+        )
+
+    client_class = APIClient
+
+    # Endpoint URLs shared by the tests
+    TOKEN_URL = reverse_lazy('accounts:token_obtain_pair')
+    RESET_URL = reverse_lazy('accounts:password_reset')
+    LOGOUT_URL = reverse_lazy('accounts:logout')
+    TOKEN_REFRESH_URL = reverse_lazy('accounts:token_refresh')
+
     def setUp(self):
-        self.client = APIClient()
+        # Throttle counters live in the cache; start each test with none
+        cache.clear()
 
-    @given(
-        email=st.emails(),
-        password=st.text(min_size=8, max_size=50).filter(lambda x: any(c.isdigit() for c in x) and any(c.isalpha() for c in x))
-    )
-    def test_property_2_valid_credentials_return_tokens(self, email, password):
+    def setup_example(self):
+        super().setup_example()
+        cache.clear()
+
+    def test_property_2_valid_credentials_return_tokens(self):
         """Property 2: Valid credentials return tokens"""
-        # Create user
-        username = email.split('@')[0]  # Use email prefix as username
-        user = User.objects.create_user(username=username, email=email, password=password)
-        
         # Login with valid credentials
-        response = self.client.post(reverse('token_obtain_pair'), {
-            'email': email,
-            'password': password
+        response = self.client.post(self.TOKEN_URL, {
+            'email': self.FIXTURE_EMAIL,
+            'password': self.FIXTURE_PASSWORD
         })
         
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = response.data
         self.assertIn('access', data)
         self.assertIn('refresh', data)
-        self.assertTrue(len(data['access']) > 0)
-        self.assertTrue(len(data['refresh']) > 0)
 
-    @given(email=st.emails())
+    @http_example_settings
+    @given(
+        # At most 8 letters before the digits, so never FIXTURE_PASSWORD
+        password=passwords
+    )
+    def test_property_2_invalid_credentials_are_rejected(self, password):
+        """Property 2: Credentials that do not match are rejected"""
+        response = self.client.post(self.TOKEN_URL, {
+            'email': self.FIXTURE_EMAIL,
+            'password': password
+        })
+        
+        self.assertEqual(response.status_code, 401)
+
+    @http_example_settings
+    @given(email=emails)
     def test_property_3_password_reset_sends_secure_links(self, email):
         """Property 3: Password reset sends secure links"""
-        # Create user
-        user = User.objects.create_user(email=email, password='testpass123')
-        
-        # Clear mail outbox
-        mail.outbox = []
+        # Create user, reusing the fixture user's hash so no example hashes
+        username = email.split('@')[0]  # Use email prefix as username
+        user = User.objects.create(username=username, email=email, password=self.fixture_user.password)
         
-        # Request password reset
-        response = self.client.post(reverse('password_reset_request'), {
+        # Request password reset (the test case empties mail.outbox before
+        # every example)
+        response = self.client.post(self.RESET_URL, {
             'email': email
         })
         
@@ -62,31 +105,35 @@ class AuthenticationPropertyTests(TestCase):
         # Check email contains secure reset link
         email_body = mail.outbox[0].body
         self.assertIn('reset', email_body.lower())
-        self.assertIn('token', email_body.lower())
+        self.assertIn('http', email_body.lower())
+        self.assertIn('/password-reset-confirm/', email_body)
 
-    @given(
-        email=st.emails(),
-        password=st.text(min_size=8, max_size=50).filter(lambda x: any(c.isdigit() for c in x) and any(c.isalpha() for c in x))
-    )
-    def test_property_5_logout_invalidates_tokens(self, email, password):
+    @http_example_settings
+    @given(role=st.sampled_from([role for role, _ in User.ROLE_CHOICES]))
+    def test_property_5_logout_invalidates_tokens(self, role):
         """Property 5: Logout invalidates tokens"""
-        # Create user and get tokens
-        user = User.objects.create_user(email=email, password=password)
-        refresh = RefreshToken.for_user(user)
+        # Give the shared user the generated role and get tokens
+        User.bulk_set_role([self.fixture_user.pk], role)
+        refresh = RefreshToken.for_user(self.fixture_user)
         access_token = str(refresh.access_token)
         refresh_token = str(refresh)
         
-        # Use token to access protected endpoint
+        # Logout (blacklist token)
         self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
-        response = self.client.get(reverse('current_user'))
+        response = self.client.post(self.LOGOUT_URL, {
+            'refresh': refresh_token
+        })
         self.assertEqual(response.status_code, 200)
         
-        # Logout (blacklist token)
-        response = self.client.post(reverse('logout'), {
+        # The blacklisted refresh token can no longer issue access tokens;
+        # access tokens are stateless and stay valid until they expire
+        response = self.client.post(self.TOKEN_REFRESH_URL, {
             'refresh': refresh_token
         })
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.status_code, 401)
         
-        # Try to use token again - should fail
-        response = self.client.get(reverse('current_user'))
-        self.assertEqual(response.status_code, 401)
\ No newline at end of file
+        # Logging out again with the same token is rejected
+        response = self.client.post(self.LOGOUT_URL, {
+            'refresh': refresh_token
+        })
+        self.assertEqual(response.status_code, 400)
\ No newline at end of file
@@ -6,64 +6,154 @@ a wide range of inputs, ensuring the system behaves correctly for
 all valid user data.
 """
 
+from contextlib import contextmanager
+from itertools import count
+
 import pytest
-from hypothesis import given, strategies as st, settings, HealthCheck
+from hypothesis import example, given, strategies as st, settings
+from hypothesis.extra.django import TestCase
+from hypothesis.stateful import RuleBasedStateMachine, invariant, rule
 from django.contrib.auth.hashers import check_password
-from django.db import IntegrityError
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.urls import reverse
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
 from accounts.models import User
+from accounts.views import AdminOnlyView, InstructorOnlyView, ProtectedResourceView
+
+
+# Endpoint URLs, resolved once at import
+LOGIN_URL = reverse('accounts:login')
+LOGOUT_URL = reverse('accounts:logout')
+TOKEN_REFRESH_URL = reverse('accounts:token_refresh')
+PASSWORD_RESET_URL = reverse('accounts:password_reset')
+PROTECTED_URL = reverse('accounts:test_protected')
+INSTRUCTOR_URL = reverse('accounts:test_instructor_only')
+ADMIN_URL = reverse('accounts:test_admin_only')
+
+# Property 4 only checks status codes, so it calls the view directly and
+# skips URL resolution and the middleware stack
+api_factory = APIRequestFactory()
+protected_view = ProtectedResourceView.as_view()
+
+
+# Strategies shared by the property tests below, built once at import.
+# Regex strategies draw each string straight from the pattern instead of
+# composing it character by character.
+usernames = st.from_regex(r'[a-z0-9]{5,15}', fullmatch=True)
+passwords = st.from_regex(r'[a-zA-Z0-9!@#]{8,20}', fullmatch=True)
+names = st.from_regex(r'[a-z]{2,15}', fullmatch=True)
+
+
+def _test_user(username):
+    """
+    Create a user inside the test transaction.
+    
+    Backs the fixtures below: function-scoped fixtures are built once per
+    test, not per Hypothesis example, so examples that only vary a password
+    or token reuse one row, and the row is rolled back with the test.
+    """
+    return User.objects.create_user(
+        email=f'{username}@test.com',
+        username=username,
+        password=None
+    )
+
+
+@pytest.fixture(scope="class")
+def hashing_user():
+    """
+    One unsaved user shared by every example of the hashing property.
+    
+    Hashing and checking a password never touch the database, so no row is
+    written.
+    """
+    return User(email='hashinguser@test.com', username='hashinguser')
+
 
+@pytest.fixture
+def login_user(db):
+    """One saved user whose password each login example resets."""
+    return _test_user('loginuser')
 
-# Custom strategies for generating valid user data
-@st.composite
-def valid_email(draw):
-    """Generate valid email addresses."""
-    # Use simple ASCII letters and numbers for faster generation
-    username = draw(st.text(
-        alphabet='abcdefghijklmnopqrstuvwxyz0123456789',
-        min_size=3,
-        max_size=15
-    ))
-    domain = draw(st.text(
-        alphabet='abcdefghijklmnopqrstuvwxyz',
-        min_size=3,
-        max_size=10
-    ))
-    tld = draw(st.sampled_from(['com', 'org', 'net', 'edu', 'io']))
-    return f"{username}@{domain}.{tld}"
-
-
-@st.composite
-def valid_username(draw):
-    """Generate valid usernames."""
-    # Use simple ASCII letters and numbers for faster generation
-    return draw(st.text(
-        alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789',
-        min_size=3,
-        max_size=30
-    ))
-
-
-@st.composite
-def valid_password(draw):
-    """Generate valid passwords (at least 8 characters)."""
-    # Use printable ASCII characters excluding null, newline, and carriage return
-    # Avoid surrogates and other problematic Unicode characters
-    return draw(st.text(
-        alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()_+-=[]{}|;:,.<>?',
-        min_size=8,
-        max_size=50
-    ))
-
-
-@st.composite
-def valid_name(draw):
-    """Generate valid first/last names."""
-    # Use simple ASCII letters for faster generation
-    return draw(st.text(
-        alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ',
-        min_size=1,
-        max_size=30
-    ))
+
+@pytest.fixture
+def protected_user(db):
+    """One saved user for the protected-resource checks."""
+    return _test_user('protecteduser')
+
+
+@pytest.fixture
+def protected_access_token(protected_user):
+    """
+    Access token for protected_user, signed once per test.
+    
+    The user never changes role, so every example can present the same
+    token; an AccessToken needs no outstanding-token row either.
+    """
+    return str(AccessToken.for_user(protected_user))
+
+
+@pytest.fixture(scope="class")
+def shared_client():
+    """One API client per test class; reset it with _reset_client()."""
+    return APIClient(HTTP_ACCEPT='application/json')
+
+
+def _reset_client(client):
+    """Drop credentials and cookies left on a shared client by an earlier example."""
+    client.credentials()
+    client.cookies.clear()
+    return client
+
+
+def _request_as(client, user, method, path):
+    """
+    Send one request to path as user; writes carry a small JSON body.
+    
+    The user is force-authenticated, so no token is signed or verified;
+    properties 2 and 4 and the logout property cover the JWT path.
+    """
+    client.force_authenticate(user=user)
+    kwargs = {}
+    if method in ('post', 'put'):
+        kwargs.update(data={'test': 'data'}, content_type='application/json')
+    return getattr(client, method)(path, **kwargs)
+
+
+@contextmanager
+def _example_savepoint():
+    """
+    Roll back everything a Hypothesis example wrote.
+    
+    Hypothesis runs every example inside the one test transaction, so rows
+    from earlier examples would otherwise still be there; rolling back to a
+    savepoint is cheaper than deleting them.
+    
+    Rolled-back primary keys are handed out again, so each example also
+    starts with empty throttle counters instead of inheriting the request
+    count of the previous example's user.
+    """
+    cache.clear()
+    sid = transaction.savepoint()
+    try:
+        yield
+    finally:
+        transaction.savepoint_rollback(sid)
+
+
+def _login(client, email, password):
+    """
+    POST credentials to the login endpoint and return the response.
+    
+    Tokens are not memoized: logout blacklists them and every example's
+    rows are rolled back, so a token pair cannot outlive its example.
+    """
+    return client.post(LOGIN_URL, {
+        'email': email,
+        'password': password
+    })
 
 
 @pytest.mark.django_db
@@ -72,14 +162,14 @@ class TestUserCreationProperties:
     
     # Feature: veetssuites-platform, Property 1: Registration creates encrypted accounts
     @given(
-        username=st.text(alphabet='abcdefghijklmnopqrstuvwxyz0123456789', min_size=5, max_size=15),
-        password=st.text(alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#', min_size=8, max_size=20),
-        first_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15),
-        last_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15)
+        password=passwords,
+        first_name=names,
+        last_name=names
     )
-    @settings(max_examples=20, deadline=10000, suppress_health_check=[HealthCheck.too_slow])
+    # Pure hashing with no DB or HTTP work, so examples are cheap
+    @settings(max_examples=100)
     def test_registration_creates_encrypted_accounts(
-        self, username, password, first_name, last_name
+        self, hashing_user, password, first_name, last_name
     ):
         """
         Property 1: Registration creates encrypted accounts
@@ -90,57 +180,39 @@ class TestUserCreationProperties:
         
         Validates: Requirements 1.1
         """
-        # Generate a unique email from username to avoid collisions
-        email = f"{username}@test.com"
-        
-        # Clean up any existing user with this email or username
-        User.objects.filter(email=email).delete()
-        User.objects.filter(username=username).delete()
-        
-        try:
-            # Create user with the generated data
-            user = User.objects.create_user(
-                email=email,
-                username=username,
-                password=password,
-                first_name=first_name,
-                last_name=last_name
-            )
-            
-            # Verify the user was created
-            assert user.id is not None
-            assert user.email == email
-            
-            # CRITICAL: Password must be encrypted, not stored in plaintext
-            assert user.password != password, \
-                "Password is stored in plaintext - SECURITY VIOLATION!"
-            
-            # Verify the password is properly hashed (Django uses PBKDF2 by default)
-            assert user.password.startswith('pbkdf2_sha256$') or \
-                   user.password.startswith('argon2$') or \
-                   user.password.startswith('bcrypt$'), \
-                f"Password does not appear to be properly hashed: {user.password[:20]}"
-            
-            # Verify we can authenticate with the original password
-            assert check_password(password, user.password), \
-                "Password verification failed - encryption may be incorrect"
-            
-            # Verify we cannot authenticate with wrong password
-            assert not check_password(password + "wrong", user.password), \
-                "Password verification should fail for incorrect password"
-        finally:
-            # Clean up
-            User.objects.filter(email=email).delete()
-            User.objects.filter(username=username).delete()
+        user = hashing_user
+        user.first_name = first_name
+        user.last_name = last_name
+        
+        # Hash the generated password the way create_user does; the
+        # assertions only look at the stored hash, so nothing is written
+        user.set_password(password)
+        
+        # CRITICAL: Password must be encrypted, not stored in plaintext
+        assert user.password != password, \
+            "Password is stored in plaintext - SECURITY VIOLATION!"
+        
+        # Verify the password is properly hashed (md5 is the test-run hasher,
+        # see conftest.py)
+        assert user.password.startswith(('pbkdf2_sha256$', 'argon2$', 'bcrypt$', 'md5$')), \
+            f"Password does not appear to be properly hashed: {user.password[:20]}"
+        
+        # Verify we can authenticate with the original password
+        assert check_password(password, user.password), \
+            "Password verification failed - encryption may be incorrect"
+        
+        # Verify we cannot authenticate with wrong password
+        assert not check_password(password + "wrong", user.password), \
+            "Password verification should fail for incorrect password"
     
     # Feature: veetssuites-platform, Property 6: New accounts default to Student role
     @given(
-        username=st.text(alphabet='abcdefghijklmnopqrstuvwxyz0123456789', min_size=5, max_size=15),
-        password=st.text(alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#', min_size=8, max_size=20),
-        first_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15),
-        last_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15)
+        username=usernames,
+        password=passwords,
+        first_name=names,
+        last_name=names
     )
-    @settings(max_examples=20, deadline=10000, suppress_health_check=[HealthCheck.too_slow])
+    @settings(max_examples=20)
     def test_new_accounts_default_to_student_role(
         self, username, password, first_name, last_name
     ):
@@ -155,11 +227,7 @@ class TestUserCreationProperties:
         # Generate unique email
         email = f"{username}@test.com"
         
-        # Clean up any existing user with this email or username
-        User.objects.filter(email=email).delete()
-        User.objects.filter(username=username).delete()
-        
-        try:
+        with _example_savepoint():
             # Create user without explicitly setting role
             user = User.objects.create_user(
                 email=email,
@@ -184,19 +252,15 @@ class TestUserCreationProperties:
             # Verify the role display
             assert user.get_role_display() == 'Student', \
                 f"Role display should be 'Student', but is '{user.get_role_display()}'"
-        finally:
-            # Clean up
-            User.objects.filter(email=email).delete()
-            User.objects.filter(username=username).delete()
     
     # Additional property: Email uniqueness constraint
     @given(
-        base_username=st.text(alphabet='abcdefghijklmnopqrstuvwxyz0123456789', min_size=5, max_size=15),
-        password=st.text(alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#', min_size=8, max_size=20),
-        first_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15),
-        last_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15)
+        base_username=usernames,
+        password=passwords,
+        first_name=names,
+        last_name=names
     )
-    @settings(max_examples=20, deadline=10000, suppress_health_check=[HealthCheck.function_scoped_fixture, HealthCheck.too_slow])
+    @settings(max_examples=20)
     def test_email_uniqueness_enforced(
         self, base_username, password, first_name, last_name
     ):
@@ -206,18 +270,12 @@ class TestUserCreationProperties:
         For any email address, the system should prevent creating multiple
         user accounts with the same email, enforcing the uniqueness constraint.
         """
-        from django.db import transaction
-        
         # Generate unique email and two different usernames
         email = f"{base_username}@test.com"
         username1 = f"{base_username}1"
         username2 = f"{base_username}2"
         
-        # Clean up any existing users
-        User.objects.filter(email=email).delete()
-        User.objects.filter(username__in=[username1, username2]).delete()
-        
-        try:
+        with _example_savepoint():
             # Create first user
             user1 = User.objects.create_user(
                 email=email,
@@ -242,27 +300,25 @@ class TestUserCreationProperties:
             except IntegrityError:
                 # This is expected - email uniqueness is enforced
                 pass
-        finally:
-            # Clean up
-            User.objects.filter(email=email).delete()
-            User.objects.filter(username__in=[username1, username2]).delete()
 
 
 @pytest.mark.django_db
 class TestAuthenticationProperties:
     """Property-based tests for authentication functionality."""
     
+    @pytest.fixture(autouse=True)
+    def locmem_email(self, settings):
+        """Send mail to the in-memory outbox whatever the settings module says."""
+        settings.EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+    
     # Feature: veetssuites-platform, Property 2: Valid credentials return tokens
     @given(
-        username=st.text(alphabet='abcdefghijklmnopqrstuvwxyz0123456789', min_size=5, max_size=15),
-        password=st.text(alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#', min_size=8, max_size=20),
-        first_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15),
-        last_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15)
+        password=passwords
     )
-    @settings(max_examples=10, deadline=10000, suppress_health_check=[HealthCheck.too_slow])
-    def test_valid_credentials_return_tokens(
-        self, username, password, first_name, last_name
-    ):
+    # Each example is a full JWT round trip through the middleware stack
+    # and follows the same code path, so a few examples suffice
+    @settings(max_examples=3)
+    def test_valid_credentials_return_tokens(self, shared_client, login_user, password):
         """
         Property 2: Valid credentials return tokens
         
@@ -271,93 +327,80 @@ class TestAuthenticationProperties:
         
         Validates: Requirements 1.2
         """
-        from rest_framework.test import APIClient
         
-        # Generate unique email
-        email = f"{username}@test.com"
+        email = login_user.email
         
-        # Create API client
-        client = APIClient()
+        # Shared API client, cleared of the previous example's state
+        client = _reset_client(shared_client)
         
-        # Clean up any existing user
-        User.objects.filter(email=email).delete()
-        User.objects.filter(username=username).delete()
+        # Only the password varies between examples; store it on the shared user
+        login_user.set_password(password)
+        login_user.save(update_fields=['password'])
         
-        try:
-            # Create a user
-            user = User.objects.create_user(
-                email=email,
-                username=username,
-                password=password,
-                first_name=first_name,
-                last_name=last_name
-            )
-            
-            # Test login with valid credentials
-            response = client.post('/api/auth/login/', {
-                'email': email,
-                'password': password
-            })
-            
-            # Verify successful login
-            assert response.status_code == 200, \
-                f"Login should succeed with valid credentials, got {response.status_code}"
-            
-            data = response.json()
-            
-            # Verify tokens are returned
-            assert 'tokens' in data, "Response should contain tokens object"
-            assert 'user' in data, "Response should contain user data"
-            
-            tokens = data['tokens']
-            assert 'access' in tokens, "Tokens should contain access token"
-            assert 'refresh' in tokens, "Tokens should contain refresh token"
-            
-            # Verify tokens are not empty
-            assert tokens['access'] is not None and tokens['access'] != '', \
-                "Access token should not be empty"
-            assert tokens['refresh'] is not None and tokens['refresh'] != '', \
-                "Refresh token should not be empty"
-            
-            # Verify user data is correct
-            assert data['user']['email'] == email, \
-                f"User email should be {email}, got {data['user']['email']}"
-            assert data['user']['role'] == 'student', \
-                f"User role should be 'student', got {data['user']['role']}"
-            
-            # Test that tokens are valid JWT format (basic check)
-            access_token = tokens['access']
-            refresh_token = tokens['refresh']
-            
-            # JWT tokens have 3 parts separated by dots
-            assert len(access_token.split('.')) == 3, \
-                "Access token should be valid JWT format (3 parts)"
-            assert len(refresh_token.split('.')) == 3, \
-                "Refresh token should be valid JWT format (3 parts)"
-            
-            # Test that access token can be used for authentication
-            response = client.get(
-                '/api/auth/test/protected/',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            assert response.status_code == 200, \
-                "Access token should work for authenticated requests"
-            
-        finally:
-            # Clean up
-            User.objects.filter(email=email).delete()
-            User.objects.filter(username=username).delete()
+        # Test login with valid credentials
+        response = _login(client, email, password)
+        
+        # Verify successful login
+        assert response.status_code == 200, \
+            f"Login should succeed with valid credentials, got {response.status_code}"
+        
+        data = response.json()
+        
+        # Verify tokens are returned
+        assert 'tokens' in data, "Response should contain tokens object"
+        assert 'user' in data, "Response should contain user data"
+        
+        tokens = data['tokens']
+        assert 'access' in tokens, "Tokens should contain access token"
+        assert 'refresh' in tokens, "Tokens should contain refresh token"
+        
+        # Verify tokens are not empty
+        assert tokens['access'] is not None and tokens['access'] != '', \
+            "Access token should not be empty"
+        assert tokens['refresh'] is not None and tokens['refresh'] != '', \
+            "Refresh token should not be empty"
+        
+        # Verify user data is correct
+        assert data['user']['email'] == email, \
+            f"User email should be {email}, got {data['user']['email']}"
+        assert data['user']['role'] == 'student', \
+            f"User role should be 'student', got {data['user']['role']}"
+        
+        # Test that tokens are valid JWT format (basic check)
+        access_token = tokens['access']
+        refresh_token = tokens['refresh']
+        
+        # JWT tokens have 3 parts separated by dots
+        assert len(access_token.split('.')) == 3, \
+            "Access token should be valid JWT format (3 parts)"
+        assert len(refresh_token.split('.')) == 3, \
+            "Refresh token should be valid JWT format (3 parts)"
+        
+        # Test that access token can be used for authentication
+        response = client.get(
+            PROTECTED_URL,
+            HTTP_AUTHORIZATION=f'Bearer {access_token}'
+        )
+        assert response.status_code == 200, \
+            "Access token should work for authenticated requests"
     
     # Feature: veetssuites-platform, Property 3: Password reset sends secure links
     @given(
-        username=st.text(alphabet='abcdefghijklmnopqrstuvwxyz0123456789', min_size=5, max_size=15),
-        password=st.text(alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#', min_size=8, max_size=20),
-        first_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15),
-        last_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15)
+        username=usernames,
+        password=passwords,
+        first_name=names,
+        last_name=names
     )
-    @settings(max_examples=10, deadline=10000, suppress_health_check=[HealthCheck.too_slow])
+    # Every example creates a user and sends mail, so generate a few and pin
+    # the shortest and longest values the strategies allow
+    @example(username='aaaaa', password='Minim1!x', first_name='ab', last_name='ab')
+    @example(
+        username='zzzzz1234567890', password='Max!' + 'X' * 16,
+        first_name='z' * 15, last_name='z' * 15
+    )
+    @settings(max_examples=5)
     def test_password_reset_sends_secure_links(
-        self, username, password, first_name, last_name
+        self, shared_client, username, password, first_name, last_name
     ):
         """
         Property 3: Password reset sends secure links
@@ -367,23 +410,15 @@ class TestAuthenticationProperties:
         
         Validates: Requirements 1.3
         """
-        from rest_framework.test import APIClient
         from django.core import mail
-        from django.contrib.auth.tokens import default_token_generator
-        from django.utils.http import urlsafe_base64_encode
-        from django.utils.encoding import force_bytes
         
         # Generate unique email
         email = f"{username}@test.com"
         
-        # Create API client
-        client = APIClient()
+        # Shared API client, cleared of the previous example's state
+        client = _reset_client(shared_client)
         
-        # Clean up any existing user
-        User.objects.filter(email=email).delete()
-        User.objects.filter(username=username).delete()
-        
-        try:
+        with _example_savepoint():
             # Create a user
             user = User.objects.create_user(
                 email=email,
@@ -394,10 +429,10 @@ class TestAuthenticationProperties:
             )
             
             # Clear any existing emails
-            mail.outbox = []
+            mail.outbox.clear()
             
             # Request password reset
-            response = client.post('/api/auth/password-reset/', {
+            response = client.post(PASSWORD_RESET_URL, {
                 'email': email
             })
             
@@ -426,18 +461,12 @@ class TestAuthenticationProperties:
             # The email should contain a reset link with token
             assert 'reset' in email_body.lower(), \
                 "Email body should contain reset information"
-            
-            # Generate expected token for verification
-            token = default_token_generator.make_token(user)
-            uid = urlsafe_base64_encode(force_bytes(user.pk))
-            
-            # Verify the token is valid format (not checking exact match due to timing)
-            assert len(token) > 10, "Token should be reasonably long"
-            assert len(uid) > 0, "UID should not be empty"
+            assert 'http' in email_body.lower() and '/password-reset-confirm/' in email_body, \
+                "Email body should contain a password reset link"
             
             # Test that requesting reset for non-existent email still returns success
             # (to prevent email enumeration attacks)
-            response = client.post('/api/auth/password-reset/', {
+            response = client.post(PASSWORD_RESET_URL, {
                 'email': 'nonexistent@test.com'
             })
             assert response.status_code == 200, \
@@ -446,23 +475,19 @@ class TestAuthenticationProperties:
             # Should not send additional email for non-existent user
             assert len(mail.outbox) == 1, \
                 "Should not send email for non-existent user"
-            
-        finally:
-            # Clean up
-            User.objects.filter(email=email).delete()
-            User.objects.filter(username=username).delete()
-            mail.outbox = []
     
     # Feature: veetssuites-platform, Property 5: Logout invalidates tokens
     @given(
-        username=st.text(alphabet='abcdefghijklmnopqrstuvwxyz0123456789', min_size=5, max_size=15),
-        password=st.text(alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#', min_size=8, max_size=20),
-        first_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15),
-        last_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15)
+        username=usernames,
+        password=passwords,
+        first_name=names,
+        last_name=names
     )
-    @settings(max_examples=10, deadline=10000, suppress_health_check=[HealthCheck.too_slow])
+    # Each example is a full JWT round trip through the middleware stack
+    # and follows the same code path, so a few examples suffice
+    @settings(max_examples=3)
     def test_logout_invalidates_tokens(
-        self, username, password, first_name, last_name
+        self, shared_client, username, password, first_name, last_name
     ):
         """
         Property 5: Logout invalidates tokens
@@ -472,20 +497,15 @@ class TestAuthenticationProperties:
         
         Validates: Requirements 1.5
         """
-        from rest_framework.test import APIClient
         from rest_framework_simplejwt.tokens import RefreshToken
         
         # Generate unique email
         email = f"{username}@test.com"
         
-        # Create API client
-        client = APIClient()
-        
-        # Clean up any existing user
-        User.objects.filter(email=email).delete()
-        User.objects.filter(username=username).delete()
+        # Shared API client, cleared of the previous example's state
+        client = _reset_client(shared_client)
         
-        try:
+        with _example_savepoint():
             # Create a user
             user = User.objects.create_user(
                 email=email,
@@ -496,10 +516,7 @@ class TestAuthenticationProperties:
             )
             
             # Login to get tokens
-            response = client.post('/api/auth/login/', {
-                'email': email,
-                'password': password
-            })
+            response = _login(client, email, password)
             
             assert response.status_code == 200, "Login should succeed"
             
@@ -510,28 +527,32 @@ class TestAuthenticationProperties:
             
             # Verify tokens work before logout
             response = client.get(
-                '/api/auth/test/protected/',
+                PROTECTED_URL,
                 HTTP_AUTHORIZATION=f'Bearer {access_token}'
             )
             assert response.status_code == 200, \
                 "Access token should work before logout"
             
             # Test refresh token works before logout
-            response = client.post('/api/auth/token/refresh/', {
+            response = client.post(TOKEN_REFRESH_URL, {
                 'refresh': refresh_token
             })
             assert response.status_code == 200, \
                 "Refresh token should work before logout"
             
+            # Refresh tokens rotate, and the one just used is blacklisted;
+            # the session continues with the rotated token
+            refresh_token = response.json()['refresh']
+            
             # Logout with refresh token (need access token for authentication)
-            response = client.post('/api/auth/logout/', {
+            response = client.post(LOGOUT_URL, {
                 'refresh': refresh_token
             }, HTTP_AUTHORIZATION=f'Bearer {access_token}')
             assert response.status_code == 200, \
                 f"Logout should succeed, got {response.status_code}"
             
             # Verify refresh token is now blacklisted
-            response = client.post('/api/auth/token/refresh/', {
+            response = client.post(TOKEN_REFRESH_URL, {
                 'refresh': refresh_token
             })
             assert response.status_code == 401, \
@@ -540,23 +561,19 @@ class TestAuthenticationProperties:
             # Verify access token still works (until it expires naturally)
             # Note: Access tokens are stateless and can't be immediately invalidated
             response = client.get(
-                '/api/auth/test/protected/',
+                PROTECTED_URL,
                 HTTP_AUTHORIZATION=f'Bearer {access_token}'
             )
             # This might still work as access tokens are stateless
             # The important part is that refresh token is blacklisted
             
             # Test that trying to logout again with same token fails
-            response = client.post('/api/auth/logout/', {
+            response = client.post(LOGOUT_URL, {
                 'refresh': refresh_token
             }, HTTP_AUTHORIZATION=f'Bearer {access_token}')
             assert response.status_code == 400, \
                 "Logout with already blacklisted token should fail with 400 (bad request)"
             
-        finally:
-            # Clean up
-            User.objects.filter(email=email).delete()
-            User.objects.filter(username=username).delete()
 
 
 @pytest.mark.django_db
@@ -565,14 +582,14 @@ class TestAuthorizationProperties:
     
     # Feature: veetssuites-platform, Property 4: Protected resources require valid authentication
     @given(
-        username=st.text(alphabet='abcdefghijklmnopqrstuvwxyz0123456789', min_size=5, max_size=15),
-        password=st.text(alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#', min_size=8, max_size=20),
-        first_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15),
-        last_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15)
+        # Never a signed JWT, so always an invalid token
+        bogus_token=st.from_regex(r'[A-Za-z0-9_.-]{1,40}', fullmatch=True)
     )
-    @settings(max_examples=10, deadline=10000, suppress_health_check=[HealthCheck.too_slow])
+    # Each example checks JWTs along the same code path, so a few examples
+    # suffice
+    @settings(max_examples=3)
     def test_protected_resources_require_valid_authentication(
-        self, username, password, first_name, last_name
+        self, protected_user, protected_access_token, bogus_token
     ):
         """
         Property 4: Protected resources require valid authentication
@@ -583,389 +600,150 @@ class TestAuthorizationProperties:
         
         Validates: Requirements 1.4
         """
-        from rest_framework.test import APIClient
-        from rest_framework_simplejwt.tokens import RefreshToken
-        
-        # Generate unique email
-        email = f"{username}@test.com"
-        
-        # Create API client
-        client = APIClient()
-        
-        # Clean up any existing user
-        User.objects.filter(email=email).delete()
-        User.objects.filter(username=username).delete()
-        
-        try:
-            # Create a user
-            user = User.objects.create_user(
-                email=email,
-                username=username,
-                password=password,
-                first_name=first_name,
-                last_name=last_name
-            )
-            
-            # Test 1: Access without authentication should be denied
-            response = client.get('/api/auth/test/protected/')
-            assert response.status_code == 401, \
-                f"Expected 401 Unauthorized for unauthenticated request, got {response.status_code}"
-            
-            # Test 2: Access with valid token should be granted
-            refresh = RefreshToken.for_user(user)
-            access_token = str(refresh.access_token)
-            
-            response = client.get(
-                '/api/auth/test/protected/',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            assert response.status_code == 200, \
-                f"Expected 200 OK for authenticated request, got {response.status_code}"
-            assert response.json()['user'] == email, \
-                "Response should include authenticated user's email"
-            
-            # Test 3: Access with invalid token should be denied
-            response = client.get(
-                '/api/auth/test/protected/',
-                HTTP_AUTHORIZATION='Bearer invalid_token_12345'
-            )
-            assert response.status_code == 401, \
-                f"Expected 401 Unauthorized for invalid token, got {response.status_code}"
-            
-            # Test 4: Access with malformed authorization header should be denied
-            response = client.get(
-                '/api/auth/test/protected/',
-                HTTP_AUTHORIZATION='InvalidFormat'
-            )
-            assert response.status_code == 401, \
-                f"Expected 401 Unauthorized for malformed auth header, got {response.status_code}"
-        finally:
-            # Clean up
-            User.objects.filter(email=email).delete()
-            User.objects.filter(username=username).delete()
+        # Every example authenticates as the same user; start each one
+        # with empty throttle counters
+        cache.clear()
+        
+        # (Authorization header, expected status): no header, a valid
+        # token, an invalid token and a malformed header
+        cases = [
+            (None, 401),
+            (f'Bearer {protected_access_token}', 200),
+            (f'Bearer {bogus_token}', 401),
+            (bogus_token, 401),
+        ]
+        for auth_header, expected_status in cases:
+            headers = {'HTTP_AUTHORIZATION': auth_header} if auth_header else {}
+            response = protected_view(api_factory.get(PROTECTED_URL, **headers))
+            assert response.status_code == expected_status, \
+                f"Expected {expected_status} for Authorization {auth_header!r}, got {response.status_code}"
+            if expected_status == 200:
+                assert response.data['user'] == protected_user.email, \
+                    "Response should include authenticated user's email"
+
+
+# Expected status per role for each (method, path) the role checks cover
+ROLE_ACCESS = {
+    ('get', PROTECTED_URL): {'student': 200, 'instructor': 200, 'admin': 200},
+    ('get', INSTRUCTOR_URL): {'student': 403, 'instructor': 200, 'admin': 403},
+    ('post', INSTRUCTOR_URL): {'student': 403, 'instructor': 201, 'admin': 403},
+    ('get', ADMIN_URL): {'student': 403, 'instructor': 403, 'admin': 200},
+    ('post', ADMIN_URL): {'student': 403, 'instructor': 403, 'admin': 201},
+    ('put', ADMIN_URL): {'student': 403, 'instructor': 403, 'admin': 200},
+    ('delete', ADMIN_URL): {'student': 403, 'instructor': 403, 'admin': 204},
+}
+
+# Roles each test view's permission classes admit
+VIEW_ROLES = {
+    ProtectedResourceView: {'student', 'instructor', 'admin'},
+    InstructorOnlyView: {'instructor'},
+    AdminOnlyView: {'admin'},
+}
+
+
+class RoleAccessMachine(RuleBasedStateMachine):
+    """
+    Role transitions and the access they grant, checked on one user.
     
-    # Feature: veetssuites-platform, Property 7: Role promotion updates user permissions
-    @given(
-        username=st.text(alphabet='abcdefghijklmnopqrstuvwxyz0123456789', min_size=5, max_size=15),
-        password=st.text(alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#', min_size=8, max_size=20),
-        first_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15),
-        last_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15)
-    )
-    @settings(max_examples=10, deadline=15000, suppress_health_check=[HealthCheck.too_slow])
-    def test_role_promotion_updates_user_permissions(
-        self, username, password, first_name, last_name
-    ):
-        """
-        Property 7: Role promotion updates user permissions
-        
-        For any user promoted by an admin, the user's role should be updated to the
-        new role (instructor or admin) and subsequent permission checks should reflect
-        the new role.
-        
-        Validates: Requirements 2.2
-        """
-        from rest_framework.test import APIClient
-        from rest_framework_simplejwt.tokens import RefreshToken
-        
-        # Generate unique email
-        email = f"{username}@test.com"
-        
-        # Create API client
-        client = APIClient()
-        
-        # Clean up any existing user
-        User.objects.filter(email=email).delete()
-        User.objects.filter(username=username).delete()
-        
-        # Create a user with default student role
-        user = User.objects.create_user(
-            email=email,
-            username=username,
-            password=password,
-            first_name=first_name,
-            last_name=last_name
+    Covers, for any sequence of promotions and demotions:
+    
+    Feature: veetssuites-platform, Property 7: Role promotion updates user permissions
+    (Validates: Requirements 2.2)
+    Feature: veetssuites-platform, Property 8: Students cannot access instructor features
+    (Validates: Requirements 2.3)
+    Feature: veetssuites-platform, Property 10: Admins have full access
+    (Validates: Requirements 2.5)
+    
+    The user is created once per example and every step only changes the
+    role or makes one request, so no check pays for its own setup. The full
+    access matrix is checked against the views' permission
+    classes after every step.
+    """
+    
+    # Numbers each example's user. Hypothesis gives state machines no
+    # per-example database hook, so examples leave their rows behind and the
+    # test transaction of TestRoleAccessProperties discards them all at once.
+    _user_numbers = count()
+    
+    def __init__(self):
+        super().__init__()
+        # Start each example with empty throttle counters
+        cache.clear()
+        number = next(self._user_numbers)
+        self.user = User.objects.create_user(
+            email=f'roleaccess{number}@test.com',
+            username=f'roleaccess{number}',
+            password=None
         )
-        
-        # Verify initial role is student
-        assert user.role == 'student', "Initial role should be student"
-        
-        try:
-            # Generate token for the user
-            refresh = RefreshToken.for_user(user)
-            access_token = str(refresh.access_token)
-            
-            # Test 1: Student cannot access instructor-only endpoint
-            response = client.get(
-                '/api/auth/test/instructor-only/',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            assert response.status_code == 403, \
-                f"Student should be denied access to instructor endpoint, got {response.status_code}"
-            
-            # Promote user to instructor
-            user.promote_to_instructor()
-            user.refresh_from_db()
-            
-            # Verify role was updated
-            assert user.role == 'instructor', \
-                f"Role should be 'instructor' after promotion, got '{user.role}'"
-            assert user.is_instructor is True, \
-                "is_instructor property should return True after promotion"
-            assert user.is_student is False, \
-                "is_student property should return False after promotion"
-            
-            # Generate new token with updated role
-            refresh = RefreshToken.for_user(user)
-            access_token = str(refresh.access_token)
-            
-            # Test 2: Instructor can now access instructor-only endpoint
-            response = client.get(
-                '/api/auth/test/instructor-only/',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            assert response.status_code == 200, \
-                f"Instructor should have access to instructor endpoint, got {response.status_code}"
-            assert response.json()['role'] == 'instructor', \
-                "Response should reflect instructor role"
-            
-            # Test 3: Instructor still cannot access admin-only endpoint
-            response = client.get(
-                '/api/auth/test/admin-only/',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            assert response.status_code == 403, \
-                f"Instructor should be denied access to admin endpoint, got {response.status_code}"
-            
-            # Promote user to admin
-            user.promote_to_admin()
-            user.refresh_from_db()
-            
-            # Verify role was updated to admin
-            assert user.role == 'admin', \
-                f"Role should be 'admin' after promotion, got '{user.role}'"
-            assert user.is_admin_user is True, \
-                "is_admin_user property should return True after promotion"
-            assert user.is_instructor is False, \
-                "is_instructor property should return False after promotion to admin"
-            
-            # Generate new token with admin role
-            refresh = RefreshToken.for_user(user)
-            access_token = str(refresh.access_token)
-            
-            # Test 4: Admin can access admin-only endpoint
-            response = client.get(
-                '/api/auth/test/admin-only/',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            assert response.status_code == 200, \
-                f"Admin should have access to admin endpoint, got {response.status_code}"
-            assert response.json()['role'] == 'admin', \
-                "Response should reflect admin role"
-        finally:
-            # Clean up
-            User.objects.filter(email=email).delete()
-            User.objects.filter(username=username).delete()
+        self.expected_role = 'student'
+        # A fresh client per example, so no authentication or cookie state
+        # carries over from an earlier rule sequence
+        self.client = APIClient(HTTP_ACCEPT='application/json')
     
-    # Feature: veetssuites-platform, Property 8: Students cannot access instructor features
-    @given(
-        username=st.text(alphabet='abcdefghijklmnopqrstuvwxyz0123456789', min_size=5, max_size=15),
-        password=st.text(alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#', min_size=8, max_size=20),
-        first_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15),
-        last_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15)
-    )
-    @settings(max_examples=10, deadline=10000, suppress_health_check=[HealthCheck.too_slow])
-    def test_students_cannot_access_instructor_features(
-        self, username, password, first_name, last_name
-    ):
-        """
-        Property 8: Students cannot access instructor features
-        
-        For any user with student role, when attempting to access instructor-only
-        endpoints (course creation, session scheduling), the system should deny
-        access with a 403 error.
-        
-        Validates: Requirements 2.3
-        """
-        from rest_framework.test import APIClient
-        from rest_framework_simplejwt.tokens import RefreshToken
-        
-        # Generate unique email
-        email = f"{username}@test.com"
-        
-        # Create API client
-        client = APIClient()
-        
-        # Clean up any existing user
-        User.objects.filter(email=email).delete()
-        User.objects.filter(username=username).delete()
-        
-        try:
-            # Create a student user
-            student = User.objects.create_user(
-                email=email,
-                username=username,
-                password=password,
-                first_name=first_name,
-                last_name=last_name,
-                role='student'  # Explicitly set to student (though it's the default)
-            )
-            
-            # Verify the user is a student
-            assert student.role == 'student', "User should have student role"
-            assert student.is_student is True, "is_student should be True"
-            assert student.is_instructor is False, "is_instructor should be False"
-            
-            # Generate token for the student
-            refresh = RefreshToken.for_user(student)
-            access_token = str(refresh.access_token)
-            
-            # Test 1: Student cannot GET instructor-only resource
-            response = client.get(
-                '/api/auth/test/instructor-only/',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            assert response.status_code == 403, \
-                f"Student should be denied GET access to instructor endpoint, got {response.status_code}"
-            
-            # Test 2: Student cannot POST to instructor-only resource
-            response = client.post(
-                '/api/auth/test/instructor-only/',
-                data={'test': 'data'},
-                content_type='application/json',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            assert response.status_code == 403, \
-                f"Student should be denied POST access to instructor endpoint, got {response.status_code}"
-            
-            # Test 3: Verify student can still access general protected resources
-            response = client.get(
-                '/api/auth/test/protected/',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            assert response.status_code == 200, \
-                f"Student should have access to general protected resources, got {response.status_code}"
-            
-            # Test 4: Student cannot access admin-only resources either
-            response = client.get(
-                '/api/auth/test/admin-only/',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            assert response.status_code == 403, \
-                f"Student should be denied access to admin endpoint, got {response.status_code}"
-        finally:
-            # Clean up
-            User.objects.filter(email=email).delete()
-            User.objects.filter(username=username).delete()
+    @rule()
+    def promote_to_instructor(self):
+        self.user.promote_to_instructor()
+        self.expected_role = 'instructor'
     
-    # Feature: veetssuites-platform, Property 10: Admins have full access
-    @given(
-        username=st.text(alphabet='abcdefghijklmnopqrstuvwxyz0123456789', min_size=5, max_size=15),
-        password=st.text(alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#', min_size=8, max_size=20),
-        first_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15),
-        last_name=st.text(alphabet='abcdefghijklmnopqrstuvwxyz', min_size=2, max_size=15)
-    )
-    @settings(max_examples=10, deadline=15000, suppress_health_check=[HealthCheck.too_slow])
-    def test_admins_have_full_access(
-        self, username, password, first_name, last_name
-    ):
-        """
-        Property 10: Admins have full access
-        
-        For any user with admin role, when accessing any system endpoint, the system
-        should grant access without authorization errors.
-        
-        Validates: Requirements 2.5
-        """
-        from rest_framework.test import APIClient
-        from rest_framework_simplejwt.tokens import RefreshToken
-        
-        # Generate unique email
-        email = f"{username}@test.com"
-        
-        # Create API client
-        client = APIClient()
-        
-        # Clean up any existing user
-        User.objects.filter(email=email).delete()
-        User.objects.filter(username=username).delete()
-        
-        try:
-            # Create an admin user
-            admin = User.objects.create_user(
-                email=email,
-                username=username,
-                password=password,
-                first_name=first_name,
-                last_name=last_name
-            )
-            admin.promote_to_admin()
-            admin.refresh_from_db()
-            
-            # Verify the user is an admin
-            assert admin.role == 'admin', "User should have admin role"
-            assert admin.is_admin_user is True, "is_admin_user should be True"
-            assert admin.is_staff is True, "Admin should have is_staff set to True"
-            assert admin.is_superuser is True, "Admin should have is_superuser set to True"
-            
-            # Generate token for the admin
-            refresh = RefreshToken.for_user(admin)
-            access_token = str(refresh.access_token)
-            
-            # Test 1: Admin can access general protected resources
-            response = client.get(
-                '/api/auth/test/protected/',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            assert response.status_code == 200, \
-                f"Admin should have access to protected resources, got {response.status_code}"
-            
-            # Test 2: Admin can access instructor-only resources
-            response = client.get(
-                '/api/auth/test/instructor-only/',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            # Note: This will return 403 because IsInstructor checks for role == 'instructor'
-            # This is actually correct behavior - admins have their own endpoints
-            # Let's verify admin can access admin-only endpoints instead
-            
-            # Test 3: Admin can GET admin-only resources
-            response = client.get(
-                '/api/auth/test/admin-only/',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            assert response.status_code == 200, \
-                f"Admin should have GET access to admin endpoint, got {response.status_code}"
-            assert response.json()['role'] == 'admin', \
-                "Response should reflect admin role"
-            
-            # Test 4: Admin can POST to admin-only resources
-            response = client.post(
-                '/api/auth/test/admin-only/',
-                data={'test': 'data'},
-                content_type='application/json',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            assert response.status_code == 201, \
-                f"Admin should have POST access to admin endpoint, got {response.status_code}"
-            
-            # Test 5: Admin can PUT to admin-only resources
-            response = client.put(
-                '/api/auth/test/admin-only/',
-                data={'test': 'data'},
-                content_type='application/json',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
-            )
-            assert response.status_code == 200, \
-                f"Admin should have PUT access to admin endpoint, got {response.status_code}"
-            
-            # Test 6: Admin can DELETE admin-only resources
-            response = client.delete(
-                '/api/auth/test/admin-only/',
-                HTTP_AUTHORIZATION=f'Bearer {access_token}'
+    @rule()
+    def promote_to_admin(self):
+        self.user.promote_to_admin()
+        self.expected_role = 'admin'
+    
+    @rule()
+    def demote_to_student(self):
+        self.user.demote_to_student()
+        self.expected_role = 'student'
+    
+    @invariant()
+    def role_matches_last_transition(self):
+        user = self.user
+        assert user.role == self.expected_role, \
+            f"Role should be '{self.expected_role}', got '{user.role}'"
+        assert user.is_student is (self.expected_role == 'student')
+        assert user.is_instructor is (self.expected_role == 'instructor')
+        assert user.is_admin_user is (self.expected_role == 'admin')
+        # Promotion to admin grants staff and superuser; demotion revokes
+        # them (promote_to_instructor leaves the flags as they were)
+        if self.expected_role == 'admin':
+            assert user.is_staff and user.is_superuser
+        elif self.expected_role == 'student':
+            assert not user.is_staff and not user.is_superuser
+    
+    @rule(endpoint=st.sampled_from(sorted(ROLE_ACCESS)))
+    def check_endpoint(self, endpoint):
+        # One full round trip per step keeps URL routing and view dispatch
+        # covered; the permission matrix itself is checked directly
+        method, path = endpoint
+        expected_status = ROLE_ACCESS[endpoint][self.expected_role]
+        response = _request_as(self.client, self.user, method, path)
+        assert response.status_code == expected_status, \
+            f"{self.expected_role} {method.upper()} {path} should return {expected_status}, got {response.status_code}"
+        if method == 'get' and expected_status == 200 and path != PROTECTED_URL:
+            assert response.json()['role'] == self.expected_role, \
+                "Response should reflect the current role"
+    
+    @invariant()
+    def permissions_follow_role(self):
+        for view_class, allowed_roles in VIEW_ROLES.items():
+            request = api_factory.get('/')
+            request.user = self.user
+            view = view_class()
+            granted = all(
+                permission().has_permission(request, view)
+                for permission in view_class.permission_classes
             )
-            assert response.status_code == 204, \
-                f"Admin should have DELETE access to admin endpoint, got {response.status_code}"
-        finally:
-            # Clean up
-            User.objects.filter(email=email).delete()
-            User.objects.filter(username=username).delete()
+            assert granted is (self.expected_role in allowed_roles), \
+                f"{self.expected_role} access to {view_class.__name__} should be {not granted}"
+    
+
+
+class TestRoleAccessProperties(RoleAccessMachine.TestCase, TestCase):
+    """
+    Runs RoleAccessMachine inside a Django test transaction, under both
+    pytest and manage.py test, so its users never reach a real database.
+    """
+    
+    # Each step makes at most one HTTP request, which keeps an example well
+    # under the burst throttle
+    settings = settings(max_examples=10, stateful_step_count=5)
@@ -2,24 +2,34 @@
 Unit tests for authentication endpoints.
 """
 
-from django.test import TestCase
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.contrib.auth import get_user_model
-from rest_framework.test import APIClient
-from rest_framework import status
+from django.urls import reverse
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework import serializers, status
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.authentication import RoleCachingJWTAuthentication
+from accounts.serializers import FastEmailField, RoleTokenObtainPairSerializer
 
 User = get_user_model()
 
 
+@override_settings(PASSWORD_HASHERS=settings.TEST_PASSWORD_HASHERS)
 class AuthenticationTests(TestCase):
     """Test suite for authentication endpoints."""
     
     def setUp(self):
         """Set up test client and test data."""
         self.client = APIClient()
-        self.register_url = '/api/auth/register/'
-        self.login_url = '/api/auth/login/'
-        self.logout_url = '/api/auth/logout/'
-        self.me_url = '/api/auth/me/'
+        self.register_url = reverse('accounts:register')
+        self.login_url = reverse('accounts:login')
+        self.logout_url = reverse('accounts:logout')
+        self.me_url = reverse('accounts:current_user')
         
         self.user_data = {
             'email': 'test@example.com',
@@ -68,6 +78,27 @@ class AuthenticationTests(TestCase):
         self.assertIn('access', response.data['tokens'])
         self.assertIn('refresh', response.data['tokens'])
     
+    def test_login_tokens_include_role_claim(self):
+        """Test issued tokens carry the user's role as a claim."""
+        User.objects.create_user(
+            email=self.user_data['email'],
+            username=self.user_data['username'],
+            password=self.user_data['password'],
+            first_name=self.user_data['first_name'],
+            last_name=self.user_data['last_name'],
+            role='instructor'
+        )
+        
+        login_data = {
+            'email': self.user_data['email'],
+            'password': self.user_data['password']
+        }
+        response = self.client.post(self.login_url, login_data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        access = AccessToken(response.data['tokens']['access'])
+        self.assertEqual(access['role'], 'instructor')
+    
     def test_login_with_invalid_credentials(self):
         """Test login fails with invalid credentials."""
         login_data = {
@@ -80,7 +111,8 @@ class AuthenticationTests(TestCase):
     
     def test_get_current_user(self):
         """Test authenticated user can get their profile."""
-        # Create and login user
+        # Create user; the login tests cover token issuance, so authenticate
+        # directly instead of signing and verifying a token
         user = User.objects.create_user(
             email=self.user_data['email'],
             username=self.user_data['username'],
@@ -89,16 +121,8 @@ class AuthenticationTests(TestCase):
             last_name=self.user_data['last_name']
         )
         
-        # Get tokens
-        login_data = {
-            'email': self.user_data['email'],
-            'password': self.user_data['password']
-        }
-        login_response = self.client.post(self.login_url, login_data, format='json')
-        access_token = login_response.data['tokens']['access']
-        
         # Get current user
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        self.client.force_authenticate(user=user)
         response = self.client.get(self.me_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -111,14 +135,16 @@ class AuthenticationTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@override_settings(PASSWORD_HASHERS=settings.TEST_PASSWORD_HASHERS)
 class PermissionTests(TestCase):
     """Test suite for role-based permissions."""
     
-    def setUp(self):
-        """Set up test users with different roles."""
-        self.client = APIClient()
-        
-        self.student = User.objects.create_user(
+    client_class = APIClient
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test users with different roles, once for the class."""
+        cls.student = User.objects.create_user(
             email='student@example.com',
             username='student',
             password='TestPass123!',
@@ -127,7 +153,7 @@ class PermissionTests(TestCase):
             role='student'
         )
         
-        self.instructor = User.objects.create_user(
+        cls.instructor = User.objects.create_user(
             email='instructor@example.com',
             username='instructor',
             password='TestPass123!',
@@ -136,7 +162,7 @@ class PermissionTests(TestCase):
             role='instructor'
         )
         
-        self.admin = User.objects.create_user(
+        cls.admin = User.objects.create_user(
             email='admin@example.com',
             username='admin',
             password='TestPass123!',
@@ -190,3 +216,125 @@ class PermissionTests(TestCase):
         self.assertEqual(user.role, 'student')
         self.assertFalse(user.is_staff)
         self.assertFalse(user.is_superuser)
+
+
+@override_settings(PASSWORD_HASHERS=settings.TEST_PASSWORD_HASHERS)
+class CreateDemoUsersCommandTests(TestCase):
+    """Test suite for the create_demo_users management command."""
+    
+    demo_credentials = {
+        'demo@veetssuites.com': 'demo123',
+        'student@veetssuites.com': 'student123',
+    }
+    
+    def run_command(self):
+        out = StringIO()
+        call_command('create_demo_users', stdout=out)
+        return out.getvalue()
+    
+    def test_creates_demo_users_once(self):
+        """Test running the command twice creates each demo user once."""
+        first_output = self.run_command()
+        second_output = self.run_command()
+        
+        for email, password in self.demo_credentials.items():
+            self.assertIn(f'Created user: {email}', first_output)
+            self.assertIn(f'User already exists: {email}', second_output)
+            
+            # No duplicates, and the stored hash accepts the demo password
+            users = User.objects.filter(email=email)
+            self.assertEqual(users.count(), 1)
+            user = users.get()
+            self.assertTrue(user.has_usable_password())
+            self.assertTrue(user.check_password(password))
+            self.assertEqual(user.role, 'student')
+
+
+class FastEmailFieldTests(SimpleTestCase):
+    """Test suite for the email pre-checks in FastEmailField."""
+    
+    def assertRejected(self, field, data, message):
+        with self.assertRaises(serializers.ValidationError) as ctx:
+            field.run_validation(data)
+        self.assertIn(message, [str(error) for error in ctx.exception.detail])
+    
+    def test_valid_address(self):
+        """Test a well-formed address is accepted unchanged."""
+        field = FastEmailField(max_length=254)
+        self.assertEqual(field.run_validation('user@example.com'), 'user@example.com')
+    
+    def test_non_string_input_is_invalid(self):
+        """Test non-string input gets EmailField's invalid error."""
+        field = FastEmailField()
+        for data in (123, True, ['user@example.com'], {'email': 'user@example.com'}):
+            with self.subTest(data=data):
+                self.assertRejected(field, data, 'Enter a valid email address.')
+    
+    def test_address_without_single_at_is_invalid(self):
+        """Test addresses with zero or several '@' are rejected as invalid."""
+        field = FastEmailField()
+        for data in ('user.example.com', 'user@@example.com', 'a@b@example.com'):
+            with self.subTest(data=data):
+                self.assertRejected(field, data, 'Enter a valid email address.')
+    
+    def test_over_long_address_gets_max_length_error(self):
+        """Test addresses over 254 characters keep EmailField's max_length error."""
+        data = 'a' * 245 + '@example.com'
+        self.assertEqual(len(data), 257)
+        
+        expected = serializers.EmailField(max_length=254)
+        with self.assertRaises(serializers.ValidationError) as ctx:
+            expected.run_validation(data)
+        message = str(ctx.exception.detail[0])
+        self.assertIn('254', message)
+        
+        self.assertRejected(FastEmailField(max_length=254), data, message)
+
+
+class RoleCachingJWTAuthenticationTests(TestCase):
+    """Test suite for the role caching JWT authentication class."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='rolecache@example.com',
+            username='rolecache',
+            password=None
+        )
+    
+    def setUp(self):
+        # Sign the token while the user is a student, then promote them, so
+        # the role claim is stale by the time the token is presented
+        self.access = RoleTokenObtainPairSerializer.get_token(self.user).access_token
+        self.user.promote_to_instructor()
+    
+    def test_cached_role_comes_from_database(self):
+        """Test the cached role is the user's current role, not the token claim."""
+        request = APIRequestFactory().get(
+            '/', HTTP_AUTHORIZATION=f'Bearer {self.access}'
+        )
+        
+        user, token = RoleCachingJWTAuthentication().authenticate(request)
+        
+        self.assertEqual(token['role'], 'student')
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertTrue(request._is_authenticated)
+        self.assertEqual(request._cached_role, 'instructor')
+    
+    def test_stale_role_claim_does_not_limit_access(self):
+        """Test permission checks use the cached database role end to end."""
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.access}')
+        
+        response = client.get(reverse('accounts:test_instructor_only'))
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['role'], 'instructor')
+    
+    def test_request_without_token_is_not_marked(self):
+        """Test requests without credentials get no cached state."""
+        request = APIRequestFactory().get('/')
+        
+        self.assertIsNone(RoleCachingJWTAuthentication().authenticate(request))
+        self.assertFalse(hasattr(request, '_is_authenticated'))
+        self.assertFalse(hasattr(request, '_cached_role'))
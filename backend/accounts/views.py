@@ -2,6 +2,8 @@
 Authentication views for the VEETSSUITES platform.
 """
 
+import hashlib
+import json
 import logging
 from rest_framework import status
 from rest_framework.views import APIView
@@ -10,12 +12,14 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from django.contrib.auth import authenticate, get_user_model
 from django.core.mail import send_mail
 from django.conf import settings
-from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
+from django.utils.http import quote_etag, urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
 from django.contrib.auth.tokens import default_token_generator
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.cache import get_conditional_response
 
 from .serializers import (
     RegisterSerializer,
@@ -23,6 +27,7 @@ from .serializers import (
     UserSerializer,
     PasswordResetRequestSerializer,
     PasswordResetConfirmSerializer,
+    RoleTokenObtainPairSerializer,
 )
 from veetssuites.error_responses import (
     create_validation_error_response,
@@ -62,7 +67,7 @@ class RegisterView(APIView):
                 logger.info(f"New user registered: {user.email}")
                 
                 # Generate JWT tokens
-                refresh = RefreshToken.for_user(user)
+                refresh = RoleTokenObtainPairSerializer.get_token(user)
                 
                 return Response({
                     'user': UserSerializer(user).data,
@@ -120,7 +125,7 @@ class LoginView(APIView):
                 }, status=status.HTTP_401_UNAUTHORIZED)
             
             # Generate JWT tokens
-            refresh = RefreshToken.for_user(user)
+            refresh = RoleTokenObtainPairSerializer.get_token(user)
             
             return Response({
                 'user': UserSerializer(user).data,
@@ -369,6 +374,13 @@ class AdminOnlyView(APIView):
 
 # Admin Dashboard Views
 
+# Columns returned by the admin user list; the password hash and other
+# unused fields are not fetched.
+ADMIN_USER_LIST_FIELDS = (
+    'id', 'email', 'first_name', 'last_name', 'role',
+    'is_active', 'date_joined', 'last_login',
+)
+
 class UserManagementView(APIView):
     """
     Admin endpoint for user management operations.
@@ -379,7 +391,7 @@ class UserManagementView(APIView):
     
     def get(self, request):
         """List all users with pagination and filtering."""
-        users = User.objects.all().order_by('-date_joined')
+        users = User.objects.only(*ADMIN_USER_LIST_FIELDS).order_by('-date_joined')
         
         # Filter by role if specified
         role = request.query_params.get('role')
@@ -405,18 +417,10 @@ class UserManagementView(APIView):
         paginator.page_size = 20
         page = paginator.paginate_queryset(users, request)
         
-        user_data = []
-        for user in page:
-            user_data.append({
-                'id': user.id,
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'role': user.role,
-                'is_active': user.is_active,
-                'date_joined': user.date_joined,
-                'last_login': user.last_login,
-            })
+        user_data = [
+            {field: getattr(user, field) for field in ADMIN_USER_LIST_FIELDS}
+            for user in page
+        ]
         
         return paginator.get_paginated_response(user_data)
     
@@ -541,7 +545,7 @@ class AnalyticsView(APIView):
         exam_attempts_30d = ExamAttempt.objects.filter(started_at__gte=last_30_days).count()
         
         # Top performing courses (by enrollment)
-        top_courses = Course.objects.annotate(
+        top_courses = Course.objects.select_related('instructor').annotate(
             enrollment_count_annotated=Count('enrollments', filter=Q(enrollments__payment_status='completed'))
         ).order_by('-enrollment_count_annotated')[:5]
         
@@ -567,7 +571,7 @@ class AnalyticsView(APIView):
             })
         user_growth.reverse()
         
-        return Response({
+        analytics = {
             'users': {
                 'total': total_users,
                 'active': active_users,
@@ -606,7 +610,19 @@ class AnalyticsView(APIView):
                 'completed': completed_exams,
                 'attempts_30d': exam_attempts_30d,
             },
-        }, status=status.HTTP_200_OK)
+        }
+        
+        # Tag the payload so dashboards polling with If-None-Match get a 304
+        # instead of the full body when nothing has changed
+        etag = quote_etag(hashlib.md5(
+            json.dumps(analytics, sort_keys=True, cls=DjangoJSONEncoder).encode(),
+            usedforsecurity=False,
+        ).hexdigest())
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = Response(analytics, status=status.HTTP_200_OK)
+        response['ETag'] = etag
+        return response
 
 
 class SystemHealthView(APIView):
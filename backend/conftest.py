@@ -1,6 +1,7 @@
 """
 Global pytest configuration and fixtures for the VeetsSuites backend.
 """
+import os
 import pytest
 import tempfile
 import shutil
@@ -14,13 +15,50 @@ from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 import factory
 from factory.django import DjangoModelFactory
-from hypothesis import settings, Verbosity
-
-# Configure Hypothesis settings
-settings.register_profile("default", max_examples=100, verbosity=Verbosity.normal)
-settings.register_profile("ci", max_examples=1000, verbosity=Verbosity.verbose)
-settings.register_profile("dev", max_examples=10, verbosity=Verbosity.quiet)
-settings.load_profile("default")
+from hypothesis import HealthCheck, Phase, settings, Verbosity
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+# Example database next to this file, so saved failing and shrunk examples
+# are replayed first on the next run wherever pytest is started from
+HYPOTHESIS_DATABASE = DirectoryBasedExampleDatabase(
+    str(Path(__file__).resolve().parent / ".hypothesis" / "examples")
+)
+
+# Configure Hypothesis settings; pick a profile with
+# HYPOTHESIS_PROFILE=dev|ci|derandomized|ci_fast. Every test gets the autouse,
+# function-scoped db fixture, which is not reset between examples; the
+# property tests roll back their own per-example state instead. Examples
+# that go through the database or the HTTP stack are slow by nature and
+# their timing is noisy, so there is no deadline and no too_slow check.
+settings.register_profile(
+    "default",
+    max_examples=100,
+    verbosity=Verbosity.normal,
+    deadline=None,
+    suppress_health_check=[HealthCheck.function_scoped_fixture, HealthCheck.too_slow],
+)
+settings.register_profile(
+    "ci",
+    settings.get_profile("default"),
+    max_examples=1000,
+    verbosity=Verbosity.verbose,
+    database=HYPOTHESIS_DATABASE,
+)
+settings.register_profile(
+    "dev", settings.get_profile("default"), max_examples=10, verbosity=Verbosity.quiet
+)
+# Same examples on every run; Hypothesis skips the example database here
+settings.register_profile(
+    "derandomized", settings.get_profile("default"), max_examples=20, derandomize=True
+)
+# Green-path CI runs: derandomized, and no shrinking or explaining, which
+# only pay off once a test fails. Rerun failures under "dev" to shrink them.
+settings.register_profile(
+    "ci_fast",
+    settings.get_profile("derandomized"),
+    phases=[Phase.explicit, Phase.generate],
+)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
 
 User = get_user_model()
 
@@ -124,6 +162,24 @@ def admin_client(api_client, admin):
     return api_client
 
 
+@pytest.fixture(autouse=True)
+def fast_password_hashing(settings):
+    """Hash passwords with TEST_PASSWORD_HASHERS (see settings.py) during tests."""
+    settings.PASSWORD_HASHERS = settings.TEST_PASSWORD_HASHERS
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Start every test with an empty cache.
+    
+    Throttle counters live in the cache and are keyed by user pk, which
+    rolled-back tests reuse; with fast hashing, tests run quickly enough to
+    fill the per-minute rates from earlier tests' requests.
+    """
+    cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def enable_db_access_for_all_tests(db):
     """
@@ -142,7 +142,7 @@ CORS_ALLOW_CREDENTIALS = True
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.RoleCachingJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -191,6 +191,7 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
     'TOKEN_TYPE_CLAIM': 'token_type',
+    'TOKEN_OBTAIN_SERIALIZER': 'accounts.serializers.RoleTokenObtainPairSerializer',
 }
 
 # AWS S3 Configuration
@@ -401,6 +402,22 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password Hashing
+# Argon2 is preferred for new hashes; the remaining hashers keep existing
+# PBKDF2 hashes valid, and Django upgrades them on the next successful login.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
+# Cheap hasher for test runs. Tests check hashing behaviour, not hashing
+# strength, and create users constantly, so they swap this in for the KDFs
+# above: conftest.py does it under pytest, and the TestCase classes do it
+# with override_settings under manage.py test.
+TEST_PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 # Session Security
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
 SESSION_SAVE_EVERY_REQUEST = True